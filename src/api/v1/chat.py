@@ -63,8 +63,9 @@ async def process_audio(
                 )
             _system_prompt = conversation.get("system_prompt", settings.conversation.DEFAULT_SYSTEM_PROMPT)
             _voice_id = conversation.get("voice_id", settings.tts.DEFAULT_VOICE_ID)
-            if not _model_id and "stt_model_id" in conversation:
-                _model_id = conversation.get("stt_model_id")
+            if not _model_id:
+                # Single lookup; keeps the caller's value when the conversation has no model
+                _model_id = conversation.get("stt_model_id", _model_id)
         else:
             _system_prompt = settings.conversation.DEFAULT_SYSTEM_PROMPT
             conversation = await conversation_service.create_conversation(
@@ -115,9 +116,9 @@ async def process_audio(
                 voice_id=_voice_id,
                 conversation_id=_conversation_id
             )
-            if tts_result["success"] and "audio_base64" in tts_result:
-                tts_audio_base64 = tts_result["audio_base64"]
-            else:
+            if tts_result["success"]:
+                tts_audio_base64 = tts_result.get("audio_base64")
+            if tts_audio_base64 is None:
                 logger.warning(f"Failed to generate TTS audio: {tts_result.get('error')}")
         except Exception as tts_error:
             logger.error(f"Error generating TTS: {str(tts_error)}")
@@ -51,25 +51,8 @@ async def get_conversation_history(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Conversation {conversation_id} not found",
             )
-        messages = await conversation_service.get_conversation_messages(conversation_id)
-        formatted_messages = []
-
-        for message in messages:
-            # Handle both dictionary and object formats
-            if isinstance(message, dict):
-                # Dictionary format
-                if message.get("role") != "system":
-                    formatted_messages.append({
-                        "role": message.get("role", "user"),
-                        "content": message.get("content", "")
-                    })
-            else:
-                # MessageModel object format
-                if message.role != "system":
-                    formatted_messages.append({
-                        "role": message.role,
-                        "content": message.content
-                    })
+        # Already {"role", "content"} dicts without system messages
+        formatted_messages = await conversation_service.get_conversation_messages(conversation_id)
 
         return {
             "conversation_id": conversation_id,
@@ -152,8 +152,9 @@ class DatasetProcessor:
         # Define the output file path (using the same file name)
         output_path = output_dir / audio_file.name
 
-        # Save the resampled waveform as a WAV file
-        torchaudio.save(str(output_path), waveform, target_sample_rate)
+        # Save the resampled waveform as a 16-bit PCM WAV file; torchaudio quantizes the float
+        # waveform once while writing, and the file is half the size of the float32 default
+        torchaudio.save(str(output_path), waveform, target_sample_rate, encoding="PCM_S", bits_per_sample=16)
 
         return output_path
 
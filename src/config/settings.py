@@ -65,6 +65,10 @@ class STTSettings(BaseAppSettings):
     DEFAULT_STT_MODEL_ID: str = "StefanStefan/Wav2Vec-100-CSR"
     SPEECH_RECOGNITION_RETRIES: int = 3
     SPEECH_RECOGNITION_BACKOFF_FACTOR: int = 2
+    SPEECH_RECOGNITION_MAX_CONCURRENT_REQUESTS: int = 4  # In-flight inference requests per process
+    SPEECH_RECOGNITION_REQUESTS_PER_SECOND: float = 5.0
+    SPEECH_RECOGNITION_BURST: int = 10
+    SPEECH_RECOGNITION_THROTTLE_COOLDOWN: float = 30.0  # Seconds at half rate after a 503
 
 
 class OpenAISettings(BaseAppSettings):
@@ -83,6 +87,12 @@ class MemorySettings(BaseAppSettings):
     MEMORY_MAX_MESSAGES: int = 15
     MEMORY_SUMMARIZE_THRESHOLD: int = 5  # Number of messages before summarization
     MEMORY_SUMMARY_UPDATE_INTERVAL: int = 10  # Update summary every N messages
+    MEMORY_SUMMARIZE_MAX: int = 50  # Most recent messages fed to the summarizer
+    # Shorter histories skip optimization; defaults to MEMORY_MAX_MESSAGES + 1 and is capped there
+    MEMORY_OPTIMIZE_MIN_MESSAGES: Optional[int] = None
+    MEMORY_PROMPT_WINDOW: int = 7  # Append-only history window grows from N to 2N messages, then resets
+    MEMORY_CACHE_SIZE: int = 4096  # Memory summaries kept in process
+    MEMORY_CACHE_TTL: float = 300.0  # Seconds before a cached summary is re-read
 
 
 class TTSSettings(BaseAppSettings):
@@ -97,6 +107,7 @@ class TTSSettings(BaseAppSettings):
         "style": 0.0,
         "use_speaker_boost": True,
     }
+    VOICE_CACHE_TTL: float = 3600.0  # Seconds before the voice list is fetched again
 
 
 class DatabaseSettings(BaseAppSettings):
@@ -107,6 +118,7 @@ class DatabaseSettings(BaseAppSettings):
     MONGODB_CONVERSATIONS_COLLECTION: str = "conversations"
     MONGODB_MESSAGES_COLLECTION: str = "messages"
     MONGODB_MEMORY_COLLECTION: str = "memory_summaries"
+    MONGODB_AUDIO_BUCKET: str = "audio"
     MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
     MONGODB_CONNECT_TIMEOUT_MS: int = 10000
     MONGODB_MAX_POOL_SIZE: int = 10
@@ -128,6 +140,7 @@ class AudioSettings(BaseAppSettings):
     AUDIO_SAMPLE_RATE: int = 16000
     AUDIO_CHANNELS: int = 1
     AUDIO_FORMAT: str = "wav"
+    AUDIO_CLEANUP_INTERVAL: float = 3600.0  # seconds between sweeps of expired stored audio
 
 
 class ConversationSettings(BaseAppSettings):
@@ -139,6 +152,8 @@ class ConversationSettings(BaseAppSettings):
     Use your memory of previous conversations to make the interaction more natural.
     """
     MAX_CONVERSATION_HISTORY: int = 100
+    CONVERSATION_CACHE_SIZE: int = 1000
+    CONVERSATION_CACHE_TTL: float = 60.0
 
 
 class DataSettings(BaseAppSettings):
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import Depends
 from src.db import manager as mongo_manager
 from src.repositories.conversation import ConversationRepository
@@ -18,15 +19,23 @@ async def get_db():
     db = await mongo_manager.get_db()
     return db
 
-async def get_audio_processor():
+@lru_cache(maxsize=1)
+def _audio_processor() -> AudioProcessorMainApp:
     return AudioProcessorMainApp()
 
+async def get_audio_processor():
+    # Stateless, so one lazily built instance serves every request
+    return _audio_processor()
+
+@lru_cache(maxsize=1)
 def get_huggingface_client():
     return HuggingFaceGatewayClient()
 
+@lru_cache(maxsize=1)
 def get_openai_client():
     return OpenAIGatewayClient()
 
+@lru_cache(maxsize=1)
 def get_elevenlabs_client():
     return ElevenLabsGatewayClient()
 
@@ -42,9 +51,13 @@ async def get_audio_repository(db=Depends(get_db), audio_processor=Depends(get_a
 async def get_memory_repository(db=Depends(get_db)):
     return MemoryRepository(db)
 
-async def get_memory_service():
+@lru_cache(maxsize=1)
+def _memory_service() -> MemoryService:
     return MemoryService(summarizer_service=None)
 
+async def get_memory_service():
+    return _memory_service()
+
 async def get_conversation_service(
     conversation_repo=Depends(get_conversation_repository),
     message_repo=Depends(get_message_repository),
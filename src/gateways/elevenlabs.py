@@ -1,13 +1,46 @@
-from typing import Optional, Dict, Any
-import requests
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
+import httpx
+import orjson
 import logging
-from requests.exceptions import RequestException, HTTPError
 
 from src.config.settings import settings
 from src.errors import ExternalServiceAPIError
 
 logger = logging.getLogger(__name__)
 
+# One pooled client for the process so TLS connections to ElevenLabs stay warm and
+# concurrent syntheses share them without blocking the event loop
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Transport retries only cover failed connects, so billed synthesis requests are never replayed
+            transport=httpx.AsyncHTTPTransport(retries=2),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            timeout=httpx.Timeout(300.0, connect=10.0)  # 10 s to connect, 300 s for read, write and pool
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    if _http_client is not None:
+        await _http_client.aclose()
+
+
+# (ETag, formatted voices result) of the last voice list; lets get_voices revalidate with
+# If-None-Match and skip downloading and reformatting the list when it hasn't changed
+_voices_validator: Optional[Tuple[str, Dict[str, Any]]] = None
+
+
+@lru_cache(maxsize=32)
+def _endpoint_url(base_url: str, path: str) -> str:
+    # Calls mostly hit the default voice, so the per-voice synthesis URL is built once
+    return f"{base_url}/{path}"
+
 
 class ElevenLabsGatewayClient:
     """Client for interacting with ElevenLabs API"""
@@ -15,47 +48,70 @@ class ElevenLabsGatewayClient:
     def __init__(self, base_url: str = "https://api.elevenlabs.io/v1"):
         self._base_url = base_url
         self._api_key = settings.auth.ELEVENLABS_API_KEY
+        # Built once; only copied when a call adds its own headers
+        self._default_headers = {"xi-api-key": self._api_key, "Content-Type": "application/json"}
 
-    def _make_request(
+    def rotate_key(self, api_key: Optional[str] = None) -> None:
+        """
+        Replace the cached API key and rebuild the default headers.
+
+        The client is a process-wide singleton that reads the key once, so a rotated key
+        must be pushed here explicitly; defaults to re-reading the settings value.
+        """
+        self._api_key = api_key if api_key is not None else settings.auth.ELEVENLABS_API_KEY
+        self._default_headers = {"xi-api-key": self._api_key, "Content-Type": "application/json"}
+
+    async def _send(
             self,
             path: str,
             method: str = 'GET',
             data: Optional[Dict[Any, Any]] = None,
             headers: Optional[Dict[Any, str]] = None,
-            params: Optional[Dict[Any, str]] = None,
-            return_raw: bool = False
-    ):
-        default_headers = {"xi-api-key": self._api_key, "Content-Type": "application/json"}
-
+            params: Optional[Dict[Any, str]] = None
+    ) -> httpx.Response:
+        default_headers = self._default_headers
         if headers:
-            default_headers.update(headers)
+            default_headers = {**default_headers, **headers}
 
         try:
-            response = requests.request(
-                url=f'{self._base_url}/{path}',
-                method=method,
-                json=data,
+            response = await get_http_client().request(
+                method,
+                _endpoint_url(self._base_url, path),
+                # Serialized with orjson; the JSON Content-Type is already in the default headers
+                content=orjson.dumps(data) if data is not None else None,
                 headers=default_headers,
-                params=params,
-                timeout=(10.0, 300.0)  # (connect timeout, read timeout)
+                params=params
             )
-            response.raise_for_status()
-
-            if return_raw:
-                return response.content
-
-            if response.headers.get('Content-Type', '').startswith('application/json'):
-                return response.json()
-            return None
-
-        except (RequestException, ConnectionError):
-            raise ExternalServiceAPIError(503, "Service Unavailable")
-        except HTTPError as e:
+            # 304 only answers our own conditional requests; raise_for_status treats it as an error
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise ExternalServiceAPIError(401, "Invalid ElevenLabs API key")
             raise ExternalServiceAPIError(e.response.status_code, str(e))
+        except httpx.HTTPError:
+            raise ExternalServiceAPIError(503, "Service Unavailable")
+        return response
+
+    async def _make_request(
+            self,
+            path: str,
+            method: str = 'GET',
+            data: Optional[Dict[Any, Any]] = None,
+            headers: Optional[Dict[Any, str]] = None,
+            params: Optional[Dict[Any, str]] = None,
+            return_raw: bool = False
+    ):
+        response = await self._send(path, method=method, data=data, headers=headers, params=params)
 
-    def text_to_speech(self, text: str, voice_id: str, model_id: Optional[str] = None) -> Dict[str, Any]:
+        if return_raw:
+            return response.content
+
+        if response.headers.get('Content-Type', '').startswith('application/json'):
+            return orjson.loads(response.content)
+        return None
+
+    async def text_to_speech(self, text: str, voice_id: str, model_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Convert text to speech using ElevenLabs API.
 
@@ -86,34 +142,42 @@ class ElevenLabsGatewayClient:
         path = f"text-to-speech/{voice_id}"
 
         try:
-            audio_content = self._make_request(path=path, method="POST", data=payload, return_raw=True)
+            audio_content = await self._make_request(path=path, method="POST", data=payload, return_raw=True)
 
             return {
                 "success": True,
                 "audio_content": audio_content,
             }
         except ExternalServiceAPIError as e:
-            logger.error(f"Error generating speech with ElevenLabs: {str(e)}")
+            logger.error("Error generating speech with ElevenLabs: %s", e)
             return {
                 "success": False,
                 "error": f"API error {e.code}: {str(e)}",
             }
         except Exception as e:
-            logger.error(f"Error generating speech: {str(e)}")
+            logger.error("Error generating speech: %s", e)
             return {
                 "success": False,
                 "error": f"Unexpected error: {str(e)}",
             }
 
-    def get_voices(self) -> Dict[str, Any]:
+    async def get_voices(self) -> Dict[str, Any]:
         """
         Get available voices from ElevenLabs API.
 
         Returns:
             Dict with voices data or error message
         """
+        global _voices_validator
         try:
-            voices_data = self._make_request(path="voices")
+            headers = {"If-None-Match": _voices_validator[0]} if _voices_validator else None
+            response = await self._send(path="voices", headers=headers)
+            if response.status_code == 304:
+                return _voices_validator[1]
+
+            voices_data = None
+            if response.headers.get('Content-Type', '').startswith('application/json'):
+                voices_data = orjson.loads(response.content)
 
             # Format the voice data for the API response
             voices = []
@@ -128,11 +192,14 @@ class ElevenLabsGatewayClient:
                     for voice in voices_data.get("voices", [])
                 ]
 
-            return {"success": True, "voices": voices}
+            result = {"success": True, "voices": voices}
+            etag = response.headers.get("ETag")
+            _voices_validator = (etag, result) if etag else None
+            return result
 
         except ExternalServiceAPIError as e:
-            logger.error(f"Error fetching voices from ElevenLabs: {str(e)}")
+            logger.error("Error fetching voices from ElevenLabs: %s", e)
             return {"success": False, "error": f"API error {e.code}: {str(e)}"}
         except Exception as e:
-            logger.error(f"Error fetching voices: {str(e)}")
+            logger.error("Error fetching voices: %s", e)
             return {"success": False, "error": f"Unexpected error: {str(e)}"}
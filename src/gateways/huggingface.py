@@ -1,12 +1,102 @@
-import time
+import asyncio
 import logging
-from typing import Optional, Dict, Any
-import requests
+import re
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional, Dict, Any, Tuple
+import httpx
+import orjson
 
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Failure messages the inference API can return with a 200 status, matched in one scan
+_FAILURE_MARKERS_RE = re.compile(r"[Ff]ailed to transcribe|Error processing audio")
+
+
+class _RetrySchedule(NamedTuple):
+    """Per-attempt timeouts and backoff waits for one (max_retries, backoff_factor) pair."""
+    timeouts: Tuple[httpx.Timeout, ...]
+    failure_text_waits: Tuple[float, ...]
+    unavailable_waits: Tuple[float, ...]
+    error_waits: Tuple[float, ...]
+    timeout_waits: Tuple[float, ...]
+    exception_waits: Tuple[float, ...]
+
+
+@lru_cache(maxsize=8)
+def _retry_schedule(max_retries: int, backoff_factor: float) -> _RetrySchedule:
+    attempts = range(max_retries)
+    return _RetrySchedule(
+        # Use a longer timeout for the first attempt (model loading); connecting should never take long
+        timeouts=tuple(httpx.Timeout(30.0 if a == 0 else 15.0, connect=5.0) for a in attempts),
+        failure_text_waits=tuple(max(3, (backoff_factor ** a) * 2) for a in attempts),
+        unavailable_waits=tuple(max(5, (backoff_factor ** a) * 2) for a in attempts),
+        error_waits=tuple((backoff_factor ** a) * 1.5 + 1 for a in attempts),
+        timeout_waits=tuple((backoff_factor ** a) * 2 + 3 for a in attempts),
+        exception_waits=tuple((backoff_factor ** a) + 2 for a in attempts),
+    )
+
+
+class _TokenBucket:
+    """Async token bucket limiter; back_off() halves the refill rate for a cooldown window."""
+
+    def __init__(self, rate: float, burst: int, cooldown: float):
+        self._rate = rate
+        self._burst = burst
+        self._cooldown = cooldown
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _current_rate(self, now: float) -> float:
+        return self._rate / 2 if now < self._throttled_until else self._rate
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                rate = self._current_rate(now)
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / rate)
+
+    def back_off(self) -> None:
+        self._throttled_until = time.monotonic() + self._cooldown
+
+
+# Process-wide limits so bursts and cold-start 503 retries don't stampede the inference API
+_request_slots = asyncio.Semaphore(settings.stt.SPEECH_RECOGNITION_MAX_CONCURRENT_REQUESTS)
+_rate_limiter = _TokenBucket(
+    rate=settings.stt.SPEECH_RECOGNITION_REQUESTS_PER_SECOND,
+    burst=settings.stt.SPEECH_RECOGNITION_BURST,
+    cooldown=settings.stt.SPEECH_RECOGNITION_THROTTLE_COOLDOWN
+)
+
+# Shared by every gateway instance so retries and later requests reuse open connections
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=16, keepalive_expiry=75.0),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    if _http_client is not None:
+        await _http_client.aclose()
+
 
 class HuggingFaceGatewayClient:
     """Client for interacting with HuggingFace Inference API"""
@@ -15,7 +105,7 @@ class HuggingFaceGatewayClient:
         self._base_url = base_url
         self._api_key = settings.auth.HUGGINGFACE_TOKEN
 
-    def speech_to_text(
+    async def speech_to_text(
             self,
             model_id: str,
             audio_content: bytes,
@@ -48,25 +138,29 @@ class HuggingFaceGatewayClient:
             "Content-Type": content_type,
         }
 
+        schedule = _retry_schedule(_max_retries, _backoff_factor)
+
         # Try multiple times with exponential backoff
         for attempt in range(_max_retries):
             try:
-                logger.info(f"HF API attempt {attempt + 1}/{_max_retries} for model {model_id}")
-
-                # Use a longer timeout for the first attempt (model loading)
-                timeout = 30.0 if attempt == 0 else 15.0
+                logger.info("HF API attempt %s/%s for model %s", attempt + 1, _max_retries, model_id)
 
-                response = requests.post(
-                    api_url,
-                    headers=headers,
-                    data=audio_content,
-                    timeout=timeout,
-                )
+                # Slots are only held for the request itself, not across backoff waits
+                async with _request_slots:
+                    await _rate_limiter.acquire()
+                    response = await get_http_client().post(
+                        api_url,
+                        headers=headers,
+                        # Sent as-is from the caller's buffer; raw bodies go through content=, not data=
+                        content=audio_content,
+                        timeout=schedule.timeouts[attempt],
+                    )
 
                 if response.status_code == 200:
                     try:
-                        transcription_result = response.json()
-                    except ValueError:
+                        # Decode the raw body directly; skips httpx's charset detection and stdlib json
+                        transcription_result = orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
                         # Not JSON, treat as plain text
                         transcription_result = {"text": response.text}
 
@@ -77,23 +171,17 @@ class HuggingFaceGatewayClient:
                         text = str(transcription_result)
 
                     # Check for failure markers in the text
-                    failure_markers = [
-                        "Failed to transcribe",
-                        "Error processing audio",
-                        "failed to transcribe",
-                    ]
-
-                    if text and not any(marker in text for marker in failure_markers):
+                    if text and not _FAILURE_MARKERS_RE.search(text):
                         return {
                             "success": True,
                             "text": text
                         }
                     else:
-                        logger.warning(f"API returned success but with failure message: {text}")
+                        logger.warning("API returned success but with failure message: %s", text)
                         # This is likely a loading issue, so wait longer and retry
-                        wait_time = max(3, (_backoff_factor ** attempt) * 2)
-                        logger.info(f"Waiting {wait_time}s before retrying...")
-                        time.sleep(wait_time)
+                        wait_time = schedule.failure_text_waits[attempt]
+                        logger.info("Waiting %ss before retrying...", wait_time)
+                        await asyncio.sleep(wait_time)
                         continue
 
                 elif response.status_code == 401:
@@ -106,20 +194,21 @@ class HuggingFaceGatewayClient:
                     }
 
                 elif response.status_code == 503:
-                    # Service unavailable, likely model loading
-                    wait_time = max(5, (_backoff_factor ** attempt) * 2)
-                    logger.warning(f"API returned 503, model likely loading. Retry in {wait_time}s...")
-                    time.sleep(wait_time)
+                    # Service unavailable, likely model loading; slow every caller down, not just this one
+                    _rate_limiter.back_off()
+                    wait_time = schedule.unavailable_waits[attempt]
+                    logger.warning("API returned 503, model likely loading. Retry in %ss...", wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     # Other error
-                    logger.error(f"API error: {response.status_code} - {response.text}")
+                    logger.error("API error: %s - %s", response.status_code, response.text)
 
                     if attempt < _max_retries - 1:
                         # Wait longer before retrying
-                        wait_time = (_backoff_factor ** attempt) * 1.5 + 1
-                        logger.info(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        wait_time = schedule.error_waits[attempt]
+                        logger.info("Retrying in %s seconds...", wait_time)
+                        await asyncio.sleep(wait_time)
                     else:
                         # Last attempt failed
                         return {
@@ -128,13 +217,13 @@ class HuggingFaceGatewayClient:
                             "text": f"Failed to transcribe audio: API error {response.status_code}"
                         }
 
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout on attempt {attempt + 1}")
+            except httpx.TimeoutException:
+                logger.warning("Request timeout on attempt %s", attempt + 1)
                 # For timeouts, use longer delays
-                wait_time = (_backoff_factor ** attempt) * 2 + 3
+                wait_time = schedule.timeout_waits[attempt]
                 if attempt < _max_retries - 1:
-                    logger.info(f"Retrying in {wait_time} seconds after timeout...")
-                    time.sleep(wait_time)
+                    logger.info("Retrying in %s seconds after timeout...", wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     return {
                         "success": False,
@@ -143,13 +232,13 @@ class HuggingFaceGatewayClient:
                     }
 
             except Exception as e:
-                logger.error(f"Error in processing attempt {attempt + 1}: {str(e)}")
+                logger.error("Error in processing attempt %s: %s", attempt + 1, e)
 
                 if attempt < _max_retries - 1:
                     # Try again with increased delay
-                    wait_time = (_backoff_factor ** attempt) + 2
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    wait_time = schedule.exception_waits[attempt]
+                    logger.info("Retrying in %s seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     # Last attempt failed
                     return {
@@ -165,7 +254,7 @@ class HuggingFaceGatewayClient:
             "text": "Failed to transcribe audio after multiple attempts"
         }
 
-    def warm_up_inference_api(self, model_id: Optional[str] = None, audio_content: Optional[bytes] = None) -> None:
+    async def warm_up_inference_api(self, model_id: Optional[str] = None, audio_content: Optional[bytes] = None) -> None:
         """
         Send a small dummy request to the Hugging Face API to trigger model loading.
 
@@ -183,10 +272,10 @@ class HuggingFaceGatewayClient:
             audio_processor = AudioProcessorMainApp()
             audio_content = audio_processor.create_silent_audio(duration=0.5)
 
-        logger.info(f"Warming up Hugging Face Inference API for model: {_model_id}")
+        logger.info("Warming up Hugging Face Inference API for model: %s", _model_id)
 
         # Use a lower retry count for warm-up
-        self.speech_to_text(
+        await self.speech_to_text(
             model_id=_model_id,
             audio_content=audio_content,
             content_type="audio/wav",
@@ -1,10 +1,28 @@
 from typing import Optional, Dict, Any, List
-import requests
-from requests.exceptions import RequestException, HTTPError
+import httpx
+import orjson
 
 from src.config.settings import settings
 from src.errors import ExternalServiceAPIError
 
+# One pooled client for the whole process so TLS connections to OpenAI stay warm across requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=httpx.Timeout(60.0, connect=10.0)  # 10 s to connect, 60 s for read, write and pool
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    if _http_client is not None:
+        await _http_client.aclose()
+
 
 class OpenAIGatewayClient:
     """Client for interacting with OpenAI API"""
@@ -13,7 +31,7 @@ class OpenAIGatewayClient:
         self._base_url = base_url
         self._api_key = settings.auth.OPENAI_API_KEY
 
-    def _make_request(
+    async def _make_request(
             self,
             path: str,
             method: str = 'POST',
@@ -27,25 +45,25 @@ class OpenAIGatewayClient:
             default_headers.update(headers)
 
         try:
-            response = requests.request(
-                url=f'{self._base_url}/{path}',
-                method=method,
-                json=data,
+            response = await get_http_client().request(
+                method,
+                f'{self._base_url}/{path}',
+                # Serialized with orjson; the JSON Content-Type is already in the default headers
+                content=orjson.dumps(data) if data is not None else None,
                 headers=default_headers,
-                params=params,
-                timeout=(10.0, 60.0)  # (connect timeout, read timeout)
+                params=params
             )
             response.raise_for_status()
-        except (RequestException, ConnectionError):
-            raise ExternalServiceAPIError(503, "Service Unavailable")
-        except HTTPError as e:
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise ExternalServiceAPIError(401, "Invalid OpenAI API key")
             raise ExternalServiceAPIError(e.response.status_code, str(e))
+        except httpx.HTTPError:
+            raise ExternalServiceAPIError(503, "Service Unavailable")
 
-        return response.json()
+        return orjson.loads(response.content)
 
-    def chat_completion(
+    async def chat_completion(
             self,
             messages: List[Dict[str, str]],
             model: Optional[str] = None,
@@ -77,7 +95,7 @@ class OpenAIGatewayClient:
         }
 
         try:
-            result = self._make_request(
+            result = await self._make_request(
                 path="chat/completions",
                 method="POST",
                 data=payload
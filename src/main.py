@@ -4,7 +4,7 @@ import logging
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.config.settings import settings
 from src.db import manager as mongo_manager
@@ -14,6 +14,9 @@ from src.dependencies import (
     get_audio_processor,
     get_db
 )
+from src.gateways import elevenlabs as elevenlabs_gateway
+from src.gateways import huggingface as huggingface_gateway
+from src.gateways import openai as openai_gateway
 from src.services.recognition import SpeechRecognitionService
 from src.api.v1 import router as api_router
 
@@ -24,6 +27,12 @@ logging.basicConfig(
 )
 
 
+async def _sweep_expired_audio(audio_repo) -> None:
+    while True:
+        await audio_repo.cleanup_expired()
+        await asyncio.sleep(settings.audio.AUDIO_CLEANUP_INTERVAL)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -39,15 +48,26 @@ async def lifespan(app: FastAPI):
         audio_repo = await get_audio_repository(db=db, audio_processor=audio_processor)
         sr_service = SpeechRecognitionService(hf_client, audio_repo, audio_processor)
 
-        # Schedule the warm-up coroutine in the background
-        asyncio.create_task(sr_service.warm_up_inference_api())
+        # Schedule the warm-up coroutine in the background; keep a reference so the
+        # event loop's weak reference isn't the only thing keeping it alive
+        app.state.warm_up_task = asyncio.create_task(sr_service.warm_up_inference_api())
         logger.info("Hugging Face API warm-up initiated")
+
+        # GridFS content has no TTL index, so expired audio is swept periodically
+        app.state.audio_cleanup_task = asyncio.create_task(_sweep_expired_audio(audio_repo))
     except Exception as e:
         logger.error(f"Error during startup initialization: {e}")
     try:
         yield
     finally:
-        pass
+        cleanup_task = getattr(app.state, "audio_cleanup_task", None)
+        if cleanup_task is not None:
+            cleanup_task.cancel()
+        await asyncio.gather(
+            openai_gateway.close_http_client(),
+            huggingface_gateway.close_http_client(),
+            elevenlabs_gateway.close_http_client()
+        )
 
 
 def create_app() -> FastAPI:
@@ -62,6 +82,7 @@ def create_app() -> FastAPI:
         description=settings.api.API_DESCRIPTION,
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
@@ -80,12 +101,12 @@ def create_app() -> FastAPI:
     # Exception handlers
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+        return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
-        return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+        return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
 
     # Middleware to add process time header and log request processing time
     @app.middleware("http")
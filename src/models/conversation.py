@@ -1,10 +1,16 @@
-from typing import Optional
+from typing import Optional, TypedDict
 from datetime import datetime
 from pydantic import Field, UUID4
 from src.config.settings import settings
 from src.models.base import BaseModel, TimestampMixin
 import uuid
 
+class MessageRecord(TypedDict):
+    """Role/content message as read from MongoDB and sent to the chat API"""
+    role: str
+    content: str
+
+
 class MessageModel(BaseModel):
     """Core message domain model"""
     id: Optional[UUID4] = Field(default_factory=uuid.uuid4)  # Always generate new UUIDs
@@ -33,6 +39,8 @@ class ConversationModel(BaseModel, TimestampMixin):
     stt_model_id: Optional[str] = Field(default=settings.stt.DEFAULT_STT_MODEL_ID)
     message_count: int = 0
     memory_optimized: bool = False
+    window_start_msg_idx: int = 0
+    window_start_at: Optional[datetime] = None  # Timestamp of the message at window_start_msg_idx
 
     class Meta:
         name = "conversations"
@@ -3,9 +3,10 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from bson.objectid import ObjectId
-from bson.binary import Binary
-from motor.motor_asyncio import AsyncIOMotorCollection
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorGridFSBucket
 
+from src.config.settings import settings
 from src.utils.audio.audio_handling import AudioProcessorMainApp
 from src.repositories.base import BaseRepository
 from src.models.base import BaseModel
@@ -18,18 +19,30 @@ class AudioModel(BaseModel):
         name = "audio_files"
 
 class AudioRepository(BaseRepository):
+    """
+    Audio content lives in a GridFS bucket; audio_files only keeps a small metadata document
+    sharing the GridFS file id, so metadata reads never pull audio into the working set and
+    recordings are not bound by the 16 MB document limit.
+    """
     model = AudioModel
+    # Index creation is idempotent but not free, so only issue it once per process
+    _indexes_ready = False
 
     def __init__(self, db, audio_processor: Optional[AudioProcessorMainApp] = None):
         self.audio_processor = audio_processor or AudioProcessorMainApp()
         super().__init__(db)
+        self._bucket = AsyncIOMotorGridFSBucket(db, bucket_name=settings.db.MONGODB_AUDIO_BUCKET)
+        self._files = db[f"{settings.db.MONGODB_AUDIO_BUCKET}.files"]
 
     async def _get_collection(self) -> AsyncIOMotorCollection:
         collection = self._collection
 
-        # Create indexes on this collection
-        await collection.create_index("conversation_id")
-        await collection.create_index("expires_at", expireAfterSeconds=0)
+        if not AudioRepository._indexes_ready:
+            await collection.create_index("conversation_id")
+            # Expires the metadata; the GridFS content is removed by cleanup_expired
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+            await self._files.create_index("metadata.expires_at")
+            AudioRepository._indexes_ready = True
         return collection
 
     async def save_audio(
@@ -52,25 +65,39 @@ class AudioRepository(BaseRepository):
                 except Exception as e:
                     logger.warning(f"Could not determine audio duration: {str(e)}")
 
+            collection = await self._get_collection()
+            created_at = datetime.utcnow()
+            expires_at = created_at + timedelta(hours=ttl_hours)
+            file_id = ObjectId()
+            await self._bucket.upload_from_stream_with_id(
+                file_id,
+                str(file_id),
+                audio_content,
+                metadata={
+                    "content_type": content_type,
+                    "conversation_id": conversation_id,
+                    "expires_at": expires_at
+                }
+            )
+
             audio_doc = {
-                "content": Binary(audio_content),
+                "_id": file_id,
                 "content_type": content_type,
                 "size_bytes": len(audio_content),
                 "duration": duration,
                 "conversation_id": conversation_id,
-                "created_at": datetime.utcnow(),
-                "expires_at": datetime.utcnow() + timedelta(hours=ttl_hours)
+                "created_at": created_at,
+                "expires_at": expires_at
             }
+            try:
+                await collection.insert_one(audio_doc)
+            except Exception:
+                await self._bucket.delete(file_id)
+                raise
 
-            collection = await self._get_collection()
-            result = await collection.insert_one(audio_doc)
-
-            if result.inserted_id:
-                audio_id = str(result.inserted_id)
-                logger.info(f"Saved audio file {audio_id} ({len(audio_content)} bytes)")
-                return audio_id
-
-            return None
+            audio_id = str(file_id)
+            logger.info(f"Saved audio file {audio_id} ({len(audio_content)} bytes)")
+            return audio_id
 
         except Exception as e:
             logger.error(f"Error saving audio to MongoDB: {str(e)}")
@@ -78,20 +105,28 @@ class AudioRepository(BaseRepository):
 
     async def get_audio(self, audio_id: str) -> Tuple[Optional[bytes], Optional[str]]:
         try:
-            collection = await self._get_collection()
             try:
                 object_id = ObjectId(audio_id)
             except Exception:
                 logger.warning(f"Invalid ObjectId: {audio_id}")
                 return None, None
 
-            audio_doc = await collection.find_one({"_id": object_id})
+            # The GridFS file document carries the content type and expiry, so the
+            # metadata collection doesn't need a separate read
+            try:
+                grid_out = await self._bucket.open_download_stream(object_id)
+            except NoFile:
+                logger.warning(f"Audio file {audio_id} not found")
+                return None, None
 
-            if not audio_doc:
+            metadata = grid_out.metadata or {}
+            expires_at = metadata.get("expires_at")
+            if expires_at is not None and expires_at < datetime.utcnow():
+                # Expired but not swept yet; the TTL index already hides its metadata
                 logger.warning(f"Audio file {audio_id} not found")
                 return None, None
 
-            return audio_doc["content"], audio_doc["content_type"]
+            return await grid_out.read(), metadata.get("content_type")
 
         except Exception as e:
             logger.error(f"Error retrieving audio from MongoDB: {str(e)}")
@@ -100,12 +135,19 @@ class AudioRepository(BaseRepository):
     async def cleanup_expired(self) -> int:
         try:
             collection = await self._get_collection()
-            result = await collection.delete_many({
-                "expires_at": {"$lt": datetime.utcnow()}
-            })
-            if result.deleted_count > 0:
-                logger.info(f"Cleaned up {result.deleted_count} expired audio files")
-            return result.deleted_count
+            now = datetime.utcnow()
+            deleted = 0
+            # GridFS has no TTL support, so expired content is deleted here (chunks included)
+            async for file_doc in self._files.find({"metadata.expires_at": {"$lt": now}}, {"_id": 1}):
+                try:
+                    await self._bucket.delete(file_doc["_id"])
+                    deleted += 1
+                except NoFile:
+                    pass  # removed concurrently by another worker
+            await collection.delete_many({"expires_at": {"$lt": now}})
+            if deleted > 0:
+                logger.info(f"Cleaned up {deleted} expired audio files")
+            return deleted
         except Exception as e:
             logger.error(f"Error cleaning up expired audio files: {str(e)}")
             return 0
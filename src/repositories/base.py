@@ -62,11 +62,17 @@ class BaseRepository:
 
         return result
     
-    async def list(self) -> List[BaseModel]:
-        cursor = self._collection.find({})
+    async def list(self, filters: Dict[str, Any] = None, skip: int = 0, limit: int = 0) -> List[BaseModel]:
+        cursor = self._collection.find(filters or {}).skip(skip).limit(limit)
         results = await cursor.to_list(length=None)
         return [self.model.from_mongo(result) for result in results]
 
+    async def count(self, filters: Dict[str, Any] = None) -> int:
+        """Count documents; unfiltered counts come from collection metadata."""
+        if not filters:
+            return await self._collection.estimated_document_count()
+        return await self._collection.count_documents(filters)
+
     async def update(self, _id: uuid.UUID, data: Dict[str, Any], **kwargs) -> Optional[BaseModel]:
         instance = await self._collection.find_one_and_update(
             {"_id": _id},
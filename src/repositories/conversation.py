@@ -1,10 +1,11 @@
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
+from src.config.settings import settings
 from src.repositories.base import BaseRepository
-from src.models.conversation import ConversationModel
+from src.models.conversation import ConversationModel, MessageModel
 
 logger = logging.getLogger(__name__)
 
@@ -37,15 +38,135 @@ class ConversationRepository(BaseRepository):
             logger.error(f"Error fetching conversation: {str(e)}")
             return None
 
-    async def increment_message_count(self, conversation_id: str) -> bool:
+    async def create_with_system_message(
+            self,
+            conversation: Dict[str, Any],
+            system_message: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Increment the message count for a conversation.
+        Insert a new conversation together with its initial system message.
+
+        The conversation is stored with message_count already at 1, so no follow-up
+        existence check or counter update is needed. If the message insert fails the
+        conversation is removed again.
+
+        Returns:
+            The inserted conversation document, or None on failure
+        """
+        conversation["message_count"] = 1
+        messages = self._collection.database[MessageModel.Meta.name]
+        try:
+            result = await self._collection.insert_one(conversation)
+            if not result.acknowledged:
+                return None
+        except Exception as e:
+            logger.error(f"Error inserting conversation: {str(e)}")
+            return None
+        try:
+            await messages.insert_one(system_message)
+        except Exception as e:
+            logger.error(f"Error inserting system message, rolling back conversation: {str(e)}")
+            await self._collection.delete_one({"_id": conversation["_id"]})
+            return None
+        return conversation
+
+    async def get_message_count(self, conversation_id: str) -> Optional[int]:
+        """
+        Read a conversation's current message_count straight from the database.
+
+        Returns:
+            The count, or None if the conversation does not exist
+        """
+        conversation = await self._collection.find_one(
+            {"conversation_id": conversation_id},
+            {"_id": 0, "message_count": 1}
+        )
+        if conversation is None:
+            return None
+        return conversation.get("message_count", 0)
+
+    async def get_context_bundle(
+            self,
+            conversation_id: str,
+            include_memory: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a conversation, its memory summary and the non-system messages of its
+        prompt window.
+
+        Only the window is read from the messages collection: the total message count
+        comes from the conversation's own message_count field.
+
+        Returns:
+            {"conversation", "memory", "messages"} or None if the conversation does not
+            exist; database errors are raised rather than reported as a missing conversation
+        """
+        if include_memory:
+            documents = await self._collection.aggregate([
+                {"$match": {"conversation_id": conversation_id}},
+                {"$limit": 1},
+                {"$lookup": {
+                    "from": settings.db.MONGODB_MEMORY_COLLECTION,
+                    "localField": "conversation_id",
+                    "foreignField": "conversation_id",
+                    "pipeline": [{"$project": {"_id": 0, "summary": 1}}],
+                    "as": "memory",
+                }},
+            ]).to_list(length=1)
+            conversation = documents[0] if documents else None
+        else:
+            conversation = await self._collection.find_one({"conversation_id": conversation_id})
+        if not conversation:
+            return None
+
+        # Start at the append-only prompt window. The role predicate is not in the
+        # (conversation_id, timestamp) index, so documents skipped with skip() would still be
+        # fetched; bounding the timestamp keeps the index scan to the window itself
+        message_filter = {"conversation_id": conversation_id, "role": {"$in": ["user", "assistant"]}}
+        window_start_at = conversation.get("window_start_at")
+        skip = 0
+        if window_start_at is not None:
+            message_filter["timestamp"] = {"$gte": window_start_at}
+        else:
+            # Windows reset before window_start_at was recorded
+            skip = conversation.get("window_start_msg_idx") or 0
+        messages = await self._collection.database[MessageModel.Meta.name].find(
+            message_filter,
+            {"_id": 0, "role": 1, "content": 1}
+        ).sort("timestamp", 1).skip(skip).to_list(length=None)
+
+        memory = conversation.pop("memory", [])
+        if not isinstance(conversation["_id"], str):
+            conversation["_id"] = str(conversation["_id"])
+        return {
+            "conversation": conversation,
+            "memory": memory[0] if memory else None,
+            "messages": messages,
+        }
+
+    async def list(self, filters: Dict[str, Any] = None, skip: int = 0, limit: int = 0) -> List[Dict[str, Any]]:
+        """
+        List raw conversation documents, as consumed by the API layer.
+        """
+        cursor = self._collection.find(filters or {}).skip(skip).limit(limit)
+        conversations = await cursor.to_list(length=None)
+        for conversation in conversations:
+            if not isinstance(conversation["_id"], str):
+                conversation["_id"] = str(conversation["_id"])
+        return conversations
+
+    async def increment_message_count(self, conversation_id: str, inc: int = 1) -> bool:
+        """
+        Increment the message count for a conversation by `inc` messages.
+
+        Returns:
+            False if no conversation with this id exists
         """
         try:
             result = await self._collection.update_one(
                 {"conversation_id": conversation_id},
                 {
-                    "$inc": {"message_count": 1},
+                    "$inc": {"message_count": inc},
                     "$set": {"last_updated": datetime.utcnow().isoformat()}
                 }
             )
@@ -17,18 +17,24 @@ class MemoryModel(BaseModel):
 
 class MemoryRepository(BaseRepository):
     model = MemoryModel
+    # Index creation is idempotent but not free, so only issue it once per process
+    _indexes_ready = False
 
     def __init__(self, db):
         super().__init__(db)
 
     async def _get_collection(self):
         collection = self._collection
+        if MemoryRepository._indexes_ready:
+            return collection
         try:
             await collection.create_index(
                 [("conversation_id", 1)],
                 unique=True,
-                name="memory_conversation_id_unique"
+                name="memory_conversation_id_unique",
+                background=True
             )
+            MemoryRepository._indexes_ready = True
             logger.debug("Memory repository index created or verified")
         except PyMongoError as e:
             logger.warning(f"Error creating memory repository index: {str(e)}")
@@ -39,7 +45,7 @@ class MemoryRepository(BaseRepository):
             collection = await self._get_collection()
             memory = await collection.find_one({"conversation_id": conversation_id})
             if memory:
-                memory = self._serialize_dates(memory)
+                # Timestamps are already stored as ISO strings
                 memory["_id"] = str(memory["_id"])
             return memory
         except PyMongoError as e:
@@ -49,7 +55,12 @@ class MemoryRepository(BaseRepository):
             logger.error(f"Unexpected error getting memory summary by conversation: {str(e)}")
             return None
 
-    async def update_summary(self, conversation_id: str, summary_text: str) -> bool:
+    async def update_summary(
+            self,
+            conversation_id: str,
+            summary_text: str,
+            signature: Optional[str] = None
+    ) -> bool:
         try:
             collection = await self._get_collection()
             timestamp = datetime.utcnow().isoformat()
@@ -57,13 +68,14 @@ class MemoryRepository(BaseRepository):
             if existing:
                 result = await collection.update_one(
                     {"conversation_id": conversation_id},
-                    {"$set": {"summary": summary_text, "updated_at": timestamp}}
+                    {"$set": {"summary": summary_text, "summary_signature": signature, "updated_at": timestamp}}
                 )
                 return result.modified_count > 0
             else:
                 result = await collection.insert_one({
                     "conversation_id": conversation_id,
                     "summary": summary_text,
+                    "summary_signature": signature,
                     "created_at": timestamp,
                     "updated_at": timestamp
                 })
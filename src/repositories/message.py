@@ -1,29 +1,97 @@
 import logging
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 import uuid
 from src.repositories.base import BaseRepository
-from src.models.conversation import MessageModel
+from src.models.conversation import MessageModel, MessageRecord
 
 logger = logging.getLogger(__name__)
 
 class MessageRepository(BaseRepository):
     # Set the model to the MessageModel from our models
     model = MessageModel
+    # Index creation is idempotent but not free, so only issue it once per process
+    _indexes_ready = False
 
     def __init__(self, db):
         super().__init__(db)
 
-    async def get_by_conversation_id(self, conversation_id: uuid.UUID) -> List[Dict[str, Any]]:
+    async def _get_collection(self):
+        if not MessageRepository._indexes_ready:
+            await self._collection.create_index(
+                [("conversation_id", 1), ("timestamp", 1)],
+                name="messages_conversation_timestamp",
+                background=True
+            )
+            MessageRepository._indexes_ready = True
+        return self._collection
+
+    async def get_by_conversation_id(self, conversation_id: uuid.UUID) -> List[MessageRecord]:
+        """
+        Get all non-system messages for a conversation, oldest first.
+
+        Args:
+            conversation_id: The conversation identifier
+
+        Returns:
+            List of {"role", "content"} dictionaries
+        """
+        return await self.get_role_content(conversation_id)
+
+    async def _find_role_content(self, conversation_id: str):
+        collection = await self._get_collection()
+        # $in keeps the role predicate sargable; the (conversation_id, timestamp) index serves the sort
+        return collection.find(
+            {"conversation_id": conversation_id, "role": {"$in": ["user", "assistant"]}},
+            {"_id": 0, "role": 1, "content": 1}
+        )
+
+    async def get_role_content(self, conversation_id: str) -> List[MessageRecord]:
+        """
+        Get only the role and content of a conversation's non-system messages, oldest first.
+
+        Args:
+            conversation_id: The conversation identifier
+
+        Returns:
+            List of {"role", "content"} dictionaries
+        """
+        cursor = await self._find_role_content(conversation_id)
+        return await cursor.sort("timestamp", 1).to_list(length=None)
+
+    async def get_recent(self, conversation_id: str, n: int) -> List[MessageRecord]:
+        """
+        Get the role and content of the `n` most recent non-system messages, oldest first.
+
+        Args:
+            conversation_id: The conversation identifier
+            n: Maximum number of messages to return
+
+        Returns:
+            List of {"role", "content"} dictionaries
+        """
+        cursor = await self._find_role_content(conversation_id)
+        messages = await cursor.sort("timestamp", -1).limit(n).to_list(length=n)
+        messages.reverse()
+        return messages
+
+    async def get_recent_timestamp(self, conversation_id: str, n: int) -> Optional[datetime]:
         """
-        Get all messages for a conversation.
+        Get the timestamp of the `n`-th most recent non-system message.
 
         Args:
             conversation_id: The conversation identifier
+            n: Position counted back from the newest message, starting at 1
 
         Returns:
-            List of messages
+            The timestamp, or None if the conversation has fewer than `n` such messages
         """
-        return await self.filter(conversation_id=conversation_id)
+        collection = await self._get_collection()
+        messages = await collection.find(
+            {"conversation_id": conversation_id, "role": {"$in": ["user", "assistant"]}},
+            {"_id": 0, "timestamp": 1}
+        ).sort("timestamp", -1).skip(n - 1).limit(1).to_list(length=1)
+        return messages[0]["timestamp"] if messages else None
 
     async def update_importance(self, message_id: uuid.UUID, importance: float) -> bool:
         """
@@ -1,23 +1,57 @@
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
 from src.config.settings import settings
+from src.models.conversation import MessageRecord
 logger = logging.getLogger(__name__)
 
+# Settings are fixed after startup; resolve the hot-path values once instead of walking
+# the nested settings objects on every chat turn
+# A history of at most MEMORY_MAX_MESSAGES holds at most that many user/assistant messages,
+# so optimizing it is a no-op; a larger cutoff would let over-long histories through
+_MEMORY_OPTIMIZE_MIN_MESSAGES = min(
+    settings.memory.MEMORY_OPTIMIZE_MIN_MESSAGES or settings.memory.MEMORY_MAX_MESSAGES + 1,
+    settings.memory.MEMORY_MAX_MESSAGES + 1
+)
+_MEMORY_PROMPT_WINDOW = settings.memory.MEMORY_PROMPT_WINDOW
+_MEMORY_SUMMARIZE_THRESHOLD = settings.memory.MEMORY_SUMMARIZE_THRESHOLD
+
+# Constant summarization prefix; a stable leading message also keeps the request prompt-cacheable
+SUMMARY_SYSTEM_MESSAGE: MessageRecord = {"role": "system", "content": "You are a helpful assistant that summarizes conversations."}
+SUMMARY_INSTRUCTION = (
+    "Summarize the following conversation in a concise paragraph. "
+    "Focus on key topics, questions, and information exchanged. "
+    "Keep your summary under 150 words.\n\n"
+)
+
+# Strong references to in-flight background tasks; the event loop only keeps weak ones.
+# Module-level because ChatService is instantiated per request.
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def build_summary_messages(messages: List[MessageRecord]) -> List[MessageRecord]:
+    """Build the chat completion messages asking for a summary of `messages`."""
+    formatted_conversation = "".join(
+        f"{msg['role'].capitalize()}: {msg['content']}\n\n" for msg in messages
+    )
+    return [SUMMARY_SYSTEM_MESSAGE, {"role": "user", "content": SUMMARY_INSTRUCTION + formatted_conversation}]
+
+
 class ChatService:
     """
     Service for handling chat operations with memory management.
     """
-    def __init__(self, memory_service=None, conversation_service=None):
+    def __init__(self, memory_service=None, conversation_service=None) -> None:
         self.memory_service = memory_service
         self.conversation_service = conversation_service
-        self.external_api_client = None  # To be injected (e.g. OpenAIGatewayClient)
+        self.external_api_client: Any = None  # To be injected (e.g. OpenAIGatewayClient)
 
     async def get_chat_completion(
             self,
             prompt: str,
             conversation_id: Optional[str] = None,
-            conversation_history: Optional[List[Dict[str, str]]] = None,
+            conversation_history: Optional[List[MessageRecord]] = None,
             model: Optional[str] = None,
             temperature: Optional[float] = None,
             max_tokens: Optional[int] = None
@@ -27,16 +61,16 @@ class ChatService:
         if conversation_history is None:
             conversation_history = []
         original_history_length = len(conversation_history)
-        if self.memory_service and len(conversation_history) > 0:
+        # Short histories already fit in the memory window, so optimizing them would be a no-op pass
+        if self.memory_service and original_history_length >= _MEMORY_OPTIMIZE_MIN_MESSAGES:
             optimized_history = self.memory_service.optimize_conversation_history(conversation_history)
             optimized_history_length = len(optimized_history)
             logger.info(f"Optimized history from {original_history_length} to {optimized_history_length} messages")
             conversation_history = optimized_history
         else:
             optimized_history_length = original_history_length
-        messages = conversation_history + [{"role": "user", "content": prompt}]
-        result = await asyncio.to_thread(
-            self.external_api_client.chat_completion,
+        messages = [*conversation_history, {"role": "user", "content": prompt}]
+        result = await self.external_api_client.chat_completion(
             messages=messages,
             model=model,
             temperature=temperature,
@@ -50,25 +84,9 @@ class ChatService:
             result["optimized_history_length"] = optimized_history_length
         return result
 
-    async def summarize_conversation(self, messages: List[Dict[str, Any]]) -> str:
-        formatted_conversation = ""
-        for msg in messages:
-            role = msg["role"].capitalize()
-            content = msg["content"]
-            formatted_conversation += f"{role}: {content}\n\n"
-        summarization_prompt = (
-            "Summarize the following conversation in a concise paragraph. "
-            "Focus on key topics, questions, and information exchanged. "
-            "Keep your summary under 150 words.\n\n"
-            f"{formatted_conversation}"
-        )
-        summary_messages = [
-            {"role": "system", "content": "You are a helpful assistant that summarizes conversations."},
-            {"role": "user", "content": summarization_prompt},
-        ]
-        result = await asyncio.to_thread(
-            self.external_api_client.chat_completion,
-            messages=summary_messages,
+    async def summarize_conversation(self, messages: List[MessageRecord]) -> str:
+        result = await self.external_api_client.chat_completion(
+            messages=build_summary_messages(messages),
             temperature=0.3,
             max_tokens=200
         )
@@ -79,6 +97,12 @@ class ChatService:
             logger.error(f"Error generating conversation summary: {result.get('error')}")
             return ""
 
+    async def _safe_summarize_memory(self, conversation_id: str) -> None:
+        try:
+            await self.conversation_service.summarize_memory(conversation_id)
+        except Exception as e:
+            logger.error(f"Error summarizing memory, but continuing: {str(e)}")
+
     async def process_chat_with_conversation(
             self,
             conversation_id: str,
@@ -100,6 +124,7 @@ class ChatService:
                     "error": f"Conversation {conversation_id} not found",
                     "message": "Conversation not found"
                 }
+            user_timestamp = datetime.utcnow()
             result = await self.get_chat_completion(
                 prompt=user_message,
                 conversation_id=conversation_id,
@@ -108,42 +133,36 @@ class ChatService:
             )
             if not result["success"]:
                 return result
-            await self.conversation_service.add_message(
-                conversation_id=conversation_id,
-                role="user",
-                content=user_message
-            )
-            await self.conversation_service.add_message(
+            # Store both turns in one round-trip; explicit timestamps keep user/assistant ordering stable
+            await self.conversation_service.add_messages_bulk(
                 conversation_id=conversation_id,
-                role="assistant",
-                content=result["message"]
+                messages=[
+                    ("user", user_message, user_timestamp),
+                    ("assistant", result["message"], datetime.utcnow()),
+                ]
             )
-            message_count = conversation.get("message_count", 0) + 2
-            if message_count >= settings.memory.MEMORY_SUMMARIZE_THRESHOLD:
-                try:
-                    await self.conversation_service.summarize_memory(conversation_id)
-                except Exception as e:
-                    logger.error(f"Error summarizing memory, but continuing: {str(e)}")
+            # Re-read after the insert: extracting the context refreshed the cached count from
+            # the database, so this includes messages added by other workers
+            conversation = await self.conversation_service.get_conversation(conversation_id) or conversation
+            message_count = conversation.get("message_count", 0)
+            # The window indexes non-system messages; message_count also includes the initial system prompt
+            history_count = message_count - 1
+            window_start = conversation.get("window_start_msg_idx", 0)
+            window_size = _MEMORY_PROMPT_WINDOW
+            if history_count - window_start >= 2 * window_size:
+                # Reset the prompt window to the latest N messages; until the next reset
+                # each request only appends to the previous prompt, keeping it cacheable
+                await self.conversation_service.reset_prompt_window(
+                    conversation_id, history_count - window_size, window_size
+                )
+            if message_count >= _MEMORY_SUMMARIZE_THRESHOLD:
+                # The summary only feeds later turns, so don't make this response wait for it
+                task = asyncio.create_task(self._safe_summarize_memory(conversation_id))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
             result["conversation_id"] = conversation_id
-            messages = await self.conversation_service.get_conversation_messages(conversation_id)
-            if messages:
-                result["conversation_history"] = []
-                for m in messages:
-                    if isinstance(m, dict):
-                        if m.get("role") != "system":
-                            result["conversation_history"].append({
-                                "role": m.get("role"),
-                                "content": m.get("content")
-                            })
-                    else:
-                        # It's a MessageModel object
-                        if m.role != "system":
-                            result["conversation_history"].append({
-                                "role": m.role,
-                                "content": m.content
-                            })
-            else:
-                result["conversation_history"] = []
+            # Already {"role", "content"} dicts without system messages
+            result["conversation_history"] = await self.conversation_service.get_conversation_messages(conversation_id)
 
             return result
         except Exception as e:
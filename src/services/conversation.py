@@ -1,10 +1,145 @@
+import asyncio
+import hashlib
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from src.config.settings import settings
+from src.models.conversation import MessageRecord
+from src.services.chat import build_summary_messages
+from src.services.memory import MEMORY_SUMMARY_PREFIX
 logger = logging.getLogger(__name__)
 
+# Settings are fixed after startup; resolve the hot-path values once at import
+_DEFAULT_SYSTEM_PROMPT = settings.conversation.DEFAULT_SYSTEM_PROMPT
+_DEFAULT_VOICE_ID = settings.tts.DEFAULT_VOICE_ID
+_DEFAULT_STT_MODEL_ID = settings.stt.DEFAULT_STT_MODEL_ID
+_MEMORY_ENABLED = settings.memory.MEMORY_ENABLED
+_MEMORY_SUMMARIZE_MAX = settings.memory.MEMORY_SUMMARIZE_MAX
+_MEMORY_SUMMARIZE_THRESHOLD = settings.memory.MEMORY_SUMMARIZE_THRESHOLD
+_CONVERSATION_CACHE_SIZE = settings.conversation.CONVERSATION_CACHE_SIZE
+_CONVERSATION_CACHE_TTL = settings.conversation.CONVERSATION_CACHE_TTL
+_MEMORY_CACHE_SIZE = settings.memory.MEMORY_CACHE_SIZE
+_MEMORY_CACHE_TTL = settings.memory.MEMORY_CACHE_TTL
+
+# Services are built per request, so the context cache lives at module level.
+# Maps conversation_id -> (message_count, chat_history); the count acts as the version key.
+# Entries are only stored when the messages read account for the whole count, so a history
+# read while a counter update ran ahead of its insert is never cached.
+_CONTEXT_CACHE_MAX_ENTRIES = 128
+_context_cache: "OrderedDict[str, Tuple[int, List[MessageRecord]]]" = OrderedDict()
+
+
+# Conversation metadata, as a TTL+LRU map of conversation_id -> (expires_at, document).
+# Writes made through this process update or drop entries; the TTL bounds staleness
+# from writes made by other workers.
+_conversation_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Memory summaries, as a TTL+LRU map of conversation_id -> (expires_at, summary or None).
+# Summaries only change in summarize_memory, which writes the new text straight in.
+_memory_cache: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+
+
+def _invalidate_context(conversation_id: str) -> None:
+    _context_cache.pop(conversation_id, None)
+
+
+# One summarization at a time per conversation: conversation_id -> [lock, holders + waiters].
+# Entries are dropped once nobody holds or waits on them, so the map cannot grow unbounded.
+_summary_locks: Dict[str, list] = {}
+
+
+class _summary_lock:
+    """
+    Hold the per-conversation summary lock. A plain class rather than an
+    @asynccontextmanager generator, which mypyc cannot compile.
+    """
+
+    def __init__(self, conversation_id: str) -> None:
+        self.conversation_id = conversation_id
+        self.entry: list = []
+
+    def _leave(self) -> None:
+        self.entry[1] -= 1
+        if self.entry[1] == 0:
+            del _summary_locks[self.conversation_id]
+
+    async def __aenter__(self) -> None:
+        entry = _summary_locks.get(self.conversation_id)
+        if entry is None:
+            entry = _summary_locks[self.conversation_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        self.entry = entry
+        try:
+            await self.entry[0].acquire()
+        except BaseException:
+            self._leave()
+            raise
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.entry[0].release()
+        self._leave()
+
+
+def _ttl_get(cache: OrderedDict, key: str) -> Optional[tuple]:
+    """Return the live (expires_at, value) entry for `key`, dropping it if expired."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return entry
+
+
+def _ttl_put(cache: OrderedDict, key: str, value: Any, ttl: float, max_entries: int) -> None:
+    cache[key] = (time.monotonic() + ttl, value)
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _cache_conversation(conversation_id: str, conversation: Dict[str, Any]) -> None:
+    _ttl_put(_conversation_cache, conversation_id, conversation, _CONVERSATION_CACHE_TTL, _CONVERSATION_CACHE_SIZE)
+
+
+def _cache_memory_summary(conversation_id: str, summary: Optional[str]) -> None:
+    _ttl_put(_memory_cache, conversation_id, summary, _MEMORY_CACHE_TTL, _MEMORY_CACHE_SIZE)
+
+
+def _summary_signature(messages: List[MessageRecord]) -> str:
+    """Fingerprint of the messages a summary was generated from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for msg in messages:
+        digest.update(msg["role"].encode())
+        digest.update(b"\0")
+        digest.update(msg["content"].encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _invalidate_conversation(conversation_id: str) -> None:
+    _conversation_cache.pop(conversation_id, None)
+    _context_cache.pop(conversation_id, None)
+
+
+def _refresh_cached_message_count(conversation_id: str, message_count: int) -> None:
+    cached = _conversation_cache.get(conversation_id)
+    if cached is not None:
+        cached[1]["message_count"] = message_count
+
+
+def _bump_cached_message_count(conversation_id: str, inc: int) -> None:
+    cached = _conversation_cache.get(conversation_id)
+    if cached is not None:
+        conversation = cached[1]
+        conversation["message_count"] = conversation.get("message_count", 0) + inc
+        conversation["last_updated"] = datetime.utcnow().isoformat()
+
+
 class ConversationService:
     def __init__(self, conversation_repo, message_repo, memory_repo, memory_service=None, external_api_client=None):
         self.conversation_repo = conversation_repo
@@ -21,60 +156,93 @@ class ConversationService:
     ) -> Optional[Dict[str, Any]]:
         try:
             conversation_id = str(uuid.uuid4())
-            _system_prompt = system_prompt or settings.conversation.DEFAULT_SYSTEM_PROMPT
-            _voice_id = voice_id or settings.tts.DEFAULT_VOICE_ID
-            _stt_model_id = stt_model_id or settings.stt.DEFAULT_STT_MODEL_ID
-
-            # Create a ConversationModel instance instead of a dictionary
-            from src.models.conversation import ConversationModel
-            conversation = ConversationModel(
-                id=conversation_id,
-                conversation_id=conversation_id,
-                system_prompt=_system_prompt,
-                voice_id=_voice_id,
-                stt_model_id=_stt_model_id,
-                message_count=0,
-                memory_optimized=False
-            )
+            _system_prompt = system_prompt or _DEFAULT_SYSTEM_PROMPT
+            _voice_id = voice_id or _DEFAULT_VOICE_ID
+            _stt_model_id = stt_model_id or _DEFAULT_STT_MODEL_ID
+
+            # Insert the documents directly; ConversationModel is only needed for reads
+            now = datetime.utcnow()
+            timestamp = now.isoformat()
+            conversation = {
+                "_id": conversation_id,
+                "conversation_id": conversation_id,
+                "system_prompt": _system_prompt,
+                "voice_id": _voice_id,
+                "stt_model_id": _stt_model_id,
+                "message_count": 1,
+                "memory_optimized": False,
+                "window_start_msg_idx": 0,
+                "window_start_at": None,
+                "created_at": timestamp,
+                "last_updated": timestamp
+            }
+            system_message = {
+                "_id": uuid.uuid4().hex,
+                "conversation_id": conversation_id,
+                "role": "system",
+                "content": _system_prompt,
+                "timestamp": now,
+                "importance": None
+            }
 
-            created_conversation = await self.conversation_repo.create(conversation)
+            # The conversation is new, so the system message needs no existence check or counter bump
+            created_conversation = await self.conversation_repo.create_with_system_message(
+                conversation, system_message
+            )
 
             if created_conversation:
-                await self.add_message(
-                    conversation_id=conversation_id,
-                    role="system",
-                    content=_system_prompt
-                )
-                logger.info(f"Created conversation: {conversation_id}")
+                logger.info("Created conversation: %s", conversation_id)
                 return created_conversation
             else:
                 logger.error("Failed to create conversation")
                 return None
         except Exception as e:
-            logger.error(f"Error creating conversation: {str(e)}")
+            logger.error("Error creating conversation: %s", e)
             return None
 
     async def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
-        return await self.conversation_repo.get_by_conversation_id(conversation_id)
+        cached = _ttl_get(_conversation_cache, conversation_id)
+        if cached is not None:
+            return dict(cached[1])
+
+        conversation = await self.conversation_repo.get_by_conversation_id(conversation_id)
+        if conversation:
+            _cache_conversation(conversation_id, conversation)
+            return dict(conversation)
+        return conversation
 
     async def delete_conversation(self, conversation_id: str) -> bool:
         try:
             conversation_deleted = await self.conversation_repo.delete(conversation_id)
+            _invalidate_conversation(conversation_id)
+            _memory_cache.pop(conversation_id, None)
             if conversation_deleted:
-                await self.message_repo.delete_by_conversation_id(conversation_id)
-                await self.memory_repo.delete_by_conversation_id(conversation_id)
-                logger.info(f"Deleted conversation: {conversation_id}")
+                # Messages and memory are independent once the conversation is gone; both
+                # deletes run to completion even if the other one fails
+                results = await asyncio.gather(
+                    self.message_repo.delete_by_conversation_id(conversation_id),
+                    self.memory_repo.delete_by_conversation_id(conversation_id),
+                    return_exceptions=True
+                )
+                errors = [result for result in results if isinstance(result, BaseException)]
+                for error in errors:
+                    logger.error("Error deleting conversation: %s", error)
+                if errors:
+                    return False
+                logger.info("Deleted conversation: %s", conversation_id)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Error deleting conversation: {str(e)}")
+            logger.error("Error deleting conversation: %s", e)
             return False
 
     async def list_conversations(self, limit: int = 10, skip: int = 0) -> Dict[str, Any]:
-        conversations = await self.conversation_repo.list(skip=skip, limit=limit)
-        total = len(conversations)
+        conversations, total = await asyncio.gather(
+            self.conversation_repo.list(skip=skip, limit=limit),
+            self.conversation_repo.count()
+        )
         page = (skip // limit) + 1 if limit > 0 else 1
-        pages = (total // limit) + (1 if total % limit > 0 else 0)
+        pages = (total + limit - 1) // limit if limit > 0 else 1
         return {
             "conversations": conversations,
             "total": total,
@@ -88,20 +256,16 @@ class ConversationService:
             conversation_id: str,
             role: str,
             content: str,
-            timestamp: Optional[str] = None,
+            timestamp: Optional[datetime] = None,
             importance: Optional[float] = None
     ) -> Optional[Dict[str, Any]]:
         try:
-            conversation = await self.conversation_repo.get_by_conversation_id(conversation_id)
-            if not conversation:
-                logger.error(f"Cannot add message to non-existent conversation: {conversation_id}")
-                return None
+            # Create and insert a message document directly to avoid model conversion issues.
+            # The conversation isn't looked up first: the counter update only matches
+            # existing conversations, so it doubles as the existence check.
 
-            # Create and insert a message document directly to avoid model conversion issues
-            import uuid
-
-            # Generate a new unique ID for this message
-            message_id = str(uuid.uuid4())
+            # Generate a new unique ID for this message; message ids are internal, so skip the hyphens
+            message_id = uuid.uuid4().hex
 
             # Create document to insert directly into MongoDB
             message_doc = {
@@ -109,149 +273,232 @@ class ConversationService:
                 "conversation_id": conversation_id,
                 "role": role,
                 "content": content,
-                "timestamp": timestamp or datetime.utcnow().isoformat(),
+                "timestamp": timestamp or datetime.utcnow(),  # stored as a BSON date
                 "importance": importance
             }
 
-            # Insert directly using the collection
+            # Insert directly using the collection, concurrently with the counter update
             collection = self.message_repo._collection
-            result = await collection.insert_one(message_doc)
+            # return_exceptions=True: either value may be the exception its call raised
+            result: Any
+            conversation_exists: Any
+            result, conversation_exists = await asyncio.gather(
+                collection.insert_one(message_doc),
+                self.conversation_repo.increment_message_count(conversation_id),
+                return_exceptions=True
+            )
+            if isinstance(result, BaseException):
+                if conversation_exists is True:
+                    await self.conversation_repo.increment_message_count(conversation_id, inc=-1)
+                raise result
 
             if result.acknowledged:
-                await self.conversation_repo.increment_message_count(conversation_id)
-                logger.info(f"Added {role} message to conversation: {conversation_id}")
+                # False for a missing conversation, or the exception if the counter update failed;
+                # either way the count was not incremented, so the message must not stay
+                if conversation_exists is not True:
+                    await collection.delete_one({"_id": message_id})
+                    if isinstance(conversation_exists, BaseException):
+                        raise conversation_exists
+                    logger.error("Cannot add message to non-existent conversation: %s", conversation_id)
+                    return None
+                _bump_cached_message_count(conversation_id, 1)
+                _invalidate_context(conversation_id)
+                logger.info("Added %s message to conversation: %s", role, conversation_id)
                 return message_doc
             else:
-                logger.error(f"Failed to add message to conversation: {conversation_id}")
+                logger.error("Failed to add message to conversation: %s", conversation_id)
                 return None
         except Exception as e:
-            logger.error(f"Error adding message: {str(e)}")
+            logger.error("Error adding message: %s", e)
             return None
 
-    async def get_conversation_messages(self, conversation_id: str) -> List[Dict[str, Any]]:
-        return await self.message_repo.get_by_conversation_id(conversation_id)
-
-    async def extract_conversation_context(self, conversation_id: str) -> List[Dict]:
-        conversation = await self.conversation_repo.get_by_conversation_id(conversation_id)
-        if not conversation:
-            logger.warning(f"Conversation {conversation_id} not found when extracting context")
-            return []
+    async def add_messages_bulk(
+            self,
+            conversation_id: str,
+            messages: List[Tuple[str, str, Optional[datetime]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Insert several (role, content, timestamp) messages with one insert_many and one count update."""
+        try:
+            message_docs = [
+                {
+                    "_id": uuid.uuid4().hex,
+                    "conversation_id": conversation_id,
+                    "role": role,
+                    "content": content,
+                    "timestamp": timestamp or datetime.utcnow(),
+                    "importance": None
+                }
+                for role, content, timestamp in messages
+            ]
 
-        system_prompt = conversation.get("system_prompt", settings.conversation.DEFAULT_SYSTEM_PROMPT)
-        chat_history = [{"role": "system", "content": system_prompt}]
+            collection = self.message_repo._collection
+            # return_exceptions=True: either value may be the exception its call raised
+            result: Any
+            conversation_exists: Any
+            result, conversation_exists = await asyncio.gather(
+                collection.insert_many(message_docs, ordered=False),
+                self.conversation_repo.increment_message_count(conversation_id, inc=len(message_docs)),
+                return_exceptions=True
+            )
+            if isinstance(result, BaseException):
+                # A partial unordered insert is rolled back in full by _id
+                if conversation_exists is True:
+                    await asyncio.gather(
+                        collection.delete_many({"_id": {"$in": [doc["_id"] for doc in message_docs]}}),
+                        self.conversation_repo.increment_message_count(conversation_id, inc=-len(message_docs))
+                    )
+                raise result
 
-        memory_summary = None
-        try:
-            if settings.memory.MEMORY_ENABLED:
-                memory_doc = await self.memory_repo.get_by_conversation_id(conversation_id)
-                if memory_doc and "summary" in memory_doc:
-                    memory_summary = memory_doc["summary"]
+            if result.acknowledged:
+                if conversation_exists is not True:
+                    await collection.delete_many({"_id": {"$in": result.inserted_ids}})
+                    if isinstance(conversation_exists, BaseException):
+                        raise conversation_exists
+                    logger.error("Cannot add messages to non-existent conversation: %s", conversation_id)
+                    return None
+                _bump_cached_message_count(conversation_id, len(message_docs))
+                _invalidate_context(conversation_id)
+                logger.info("Added %s messages to conversation: %s", len(message_docs), conversation_id)
+                return message_docs
+            else:
+                logger.error("Failed to add messages to conversation: %s", conversation_id)
+                return None
         except Exception as e:
-            logger.error(f"Error retrieving memory summary: {str(e)}")
+            logger.error("Error adding messages: %s", e)
+            return None
 
-        if memory_summary:
-            chat_history.append({
-                "role": "system",
-                "content": f"Previous conversation summary: {memory_summary}"
-            })
+    async def get_conversation_messages(self, conversation_id: str) -> List[MessageRecord]:
+        return await self.message_repo.get_by_conversation_id(conversation_id)
 
-        try:
-            messages = await self.message_repo.get_by_conversation_id(conversation_id)
-        except Exception as e:
-            logger.error(f"Error retrieving messages: {str(e)}")
-            messages = []
-
-        if messages:
-            for message in messages:
-                if isinstance(message, dict):
-                    # It's already a dictionary
-                    if message.get("role") != "system":
-                        chat_history.append({
-                            "role": message.get("role", "user"),
-                            "content": message.get("content", "")
-                        })
-                else:
-                    # It's a MessageModel object - use attribute access
-                    if message.role != "system":
-                        chat_history.append({
-                            "role": message.role,
-                            "content": message.content
-                        })
-
-        return chat_history
+    async def extract_conversation_context(self, conversation_id: str) -> List[MessageRecord]:
+        cached = _context_cache.get(conversation_id)
+        if cached is not None:
+            # Validating a cached entry only needs the conversation's current message count.
+            # It is read from the database, not _conversation_cache: another worker may have
+            # added messages within the conversation cache TTL
+            message_count = await self.conversation_repo.get_message_count(conversation_id)
+            if message_count is None:
+                _invalidate_conversation(conversation_id)
+                logger.warning("Conversation %s not found when extracting context", conversation_id)
+                return []
+            _refresh_cached_message_count(conversation_id, message_count)
+            if cached[0] == message_count:
+                _context_cache.move_to_end(conversation_id)
+                return list(cached[1])
+
+        # Conversation with its memory summary, then the prompt window's messages;
+        # a cached summary lets the conversation read skip its memory lookup
+        cached_memory = _ttl_get(_memory_cache, conversation_id) if _MEMORY_ENABLED else None
+        bundle = await self.conversation_repo.get_context_bundle(
+            conversation_id,
+            include_memory=_MEMORY_ENABLED and cached_memory is None
+        )
+        if not bundle:
+            logger.warning("Conversation %s not found when extracting context", conversation_id)
+            return []
+
+        conversation = bundle["conversation"]
+        message_count = conversation.get("message_count", 0)
+        # Freshly read, so it also replaces any stale cached copy
+        _cache_conversation(conversation_id, conversation)
+        system_prompt = conversation.get("system_prompt", _DEFAULT_SYSTEM_PROMPT)
+        if cached_memory is not None:
+            memory_summary = cached_memory[1]
+        else:
+            memory_doc = bundle["memory"]
+            memory_summary = memory_doc.get("summary") if memory_doc else None
+            if _MEMORY_ENABLED:
+                _cache_memory_summary(conversation_id, memory_summary)
+        messages = bundle["messages"]
+
+        # Assemble the history in one sized allocation instead of growing it message by message
+        if memory_summary:
+            chat_history = [
+                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": MEMORY_SUMMARY_PREFIX + memory_summary},
+                *messages
+            ]
+        else:
+            chat_history = [{"role": "system", "content": system_prompt}, *messages]
+
+        # message_count also includes the initial system prompt
+        if (conversation.get("window_start_msg_idx") or 0) + len(messages) + 1 == message_count:
+            _context_cache[conversation_id] = (message_count, chat_history)
+            _context_cache.move_to_end(conversation_id)
+            if len(_context_cache) > _CONTEXT_CACHE_MAX_ENTRIES:
+                _context_cache.popitem(last=False)
+        else:
+            _context_cache.pop(conversation_id, None)
+        return list(chat_history)
 
     async def update_conversation(self, conversation_id: str, updates: Dict[str, Any]) -> bool:
         try:
-            conversation = await self.conversation_repo.get_by_conversation_id(conversation_id)
+            conversation = await self.get_conversation(conversation_id)
             if not conversation:
-                logger.error(f"Cannot update non-existent conversation: {conversation_id}")
+                logger.error("Cannot update non-existent conversation: %s", conversation_id)
                 return False
+            _invalidate_conversation(conversation_id)
             return await self.conversation_repo.update(conversation_id, updates)
         except Exception as e:
-            logger.error(f"Error updating conversation: {str(e)}")
+            logger.error("Error updating conversation: %s", e)
             return False
 
+    async def reset_prompt_window(self, conversation_id: str, window_start: int, window_size: int) -> bool:
+        """
+        Move the prompt window to non-system message `window_start`, the first of the
+        `window_size` most recent ones.
+
+        Its timestamp is stored alongside the index so the next context read can start at it.
+        """
+        window_start_at = await self.message_repo.get_recent_timestamp(conversation_id, window_size)
+        return await self.update_conversation(
+            conversation_id=conversation_id,
+            updates={"window_start_msg_idx": window_start, "window_start_at": window_start_at}
+        )
+
     async def summarize_memory(self, conversation_id: str) -> bool:
-        if not self.external_api_client or not settings.memory.MEMORY_ENABLED:
+        if not self.external_api_client or not _MEMORY_ENABLED:
             return False
-        try:
-            messages = await self.message_repo.get_by_conversation_id(conversation_id)
-            if len(messages) < settings.memory.MEMORY_SUMMARIZE_THRESHOLD:
-                return False
-
-            # Filter out system messages and convert objects to dictionaries
-            messages_to_summarize = []
-            for msg in messages:
-                if isinstance(msg, dict):
-                    # It's already a dictionary
-                    if msg.get("role") != "system":
-                        messages_to_summarize.append(msg)
-                else:
-                    # It's a MessageModel object
-                    if msg.role != "system":
-                        messages_to_summarize.append({
-                            "role": msg.role,
-                            "content": msg.content
-                        })
-
-            if len(messages_to_summarize) < settings.memory.MEMORY_SUMMARIZE_THRESHOLD:
-                return False
+        # Concurrent triggers queue up; once the first finishes, the summary signature
+        # makes the rest return without another completion call
+        async with _summary_lock(conversation_id):
+            return await self._summarize_memory(conversation_id)
 
-            formatted_conversation = ""
-            for msg in messages_to_summarize:
-                role = msg["role"].capitalize()
-                content = msg["content"]
-                formatted_conversation += f"{role}: {content}\n\n"
-
-            summarization_prompt = (
-                "Summarize the following conversation in a concise paragraph. "
-                "Focus on key topics, questions, and information exchanged. "
-                "Keep your summary under 150 words.\n\n"
-                f"{formatted_conversation}"
+    async def _summarize_memory(self, conversation_id: str) -> bool:
+        try:
+            # Only the latest window is summarized; the cap and system filter run inside Mongo
+            messages, memory = await asyncio.gather(
+                self.message_repo.get_recent(conversation_id, n=_MEMORY_SUMMARIZE_MAX),
+                self.memory_repo.get_by_conversation_id(conversation_id)
             )
+            # System messages are already excluded by the repository query
+            if len(messages) < _MEMORY_SUMMARIZE_THRESHOLD:
+                return False
 
-            summary_messages = [
-                {"role": "system", "content": "You are a helpful assistant that summarizes conversations."},
-                {"role": "user", "content": summarization_prompt},
-            ]
+            # The stored summary already covers exactly these messages; skip the completion call
+            signature = _summary_signature(messages)
+            if memory and memory.get("summary_signature") == signature:
+                logger.debug("Memory summary already current for conversation: %s", conversation_id)
+                return True
 
-            import asyncio
-            result = await asyncio.to_thread(
-                self.external_api_client.chat_completion,
-                messages=summary_messages,
+            result = await self.external_api_client.chat_completion(
+                messages=build_summary_messages(messages),
                 temperature=0.3,
                 max_tokens=200
             )
 
             if result["success"]:
                 summary_text = result["message"].strip()
-                updated = await self.memory_repo.update_summary(conversation_id, summary_text)
+                updated = await self.memory_repo.update_summary(conversation_id, summary_text, signature=signature)
+                _invalidate_context(conversation_id)
                 if updated:
+                    _cache_memory_summary(conversation_id, summary_text)
                     await self.conversation_repo.update(conversation_id, {"memory_optimized": True})
-                    logger.info(f"Updated memory summary for conversation: {conversation_id}")
+                    _invalidate_conversation(conversation_id)
+                    logger.info("Updated memory summary for conversation: %s", conversation_id)
                     return True
 
             return False
         except Exception as e:
-            logger.error(f"Error updating memory summary: {str(e)}")
+            logger.error("Error updating memory summary: %s", e)
             return False
@@ -1,8 +1,14 @@
 import logging
-from typing import Dict, List, Any
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List
 from src.config.settings import settings
 logger = logging.getLogger(__name__)
 
+# Leading text of the system message carrying a stored memory summary
+MEMORY_SUMMARY_PREFIX = "Previous conversation summary: "
+_CONVERSATION_ROLES = frozenset({"user", "assistant"})
+
 class MemoryService:
     def __init__(self, summarizer_service=None):
         self.summarizer_service = summarizer_service
@@ -19,7 +25,11 @@ class MemoryService:
         if len(messages) == 0:
             return []
         system_messages = []
-        conversation = []
+        # Only the tail of the conversation is ever returned, plus the last older message for the
+        # topic line, so a bounded deque replaces slicing a full copy of the history
+        conversation: Deque[Dict[str, Any]] = deque(maxlen=max(self.memory_max_messages, 1))
+        conversation_count = 0
+        has_memory_summary = False
         for msg in messages:
             if not isinstance(msg, dict):
                 logger.warning(f"Unexpected message format: {msg}")
@@ -27,29 +37,28 @@ class MemoryService:
             role = msg.get("role")
             if role == "system":
                 system_messages.append(msg)
-            elif role in ["user", "assistant"]:
+                if not has_memory_summary:
+                    # A prefix check stays O(1) in the summary's length, unlike a substring scan
+                    content = msg.get("content") or ""
+                    has_memory_summary = content.startswith(MEMORY_SUMMARY_PREFIX)
+            elif role in _CONVERSATION_ROLES:
                 conversation.append(msg)
+                conversation_count += 1
             else:
                 logger.warning(f"Unknown message role: {role}")
-        if len(conversation) <= self.memory_max_messages:
-            return system_messages + conversation
-        for msg in system_messages:
-            content = msg.get("content", "")
-            if content and "Previous conversation summary:" in content:
-                keep_count = min(self.memory_max_messages, len(conversation))
-                recent_messages = conversation[-keep_count:]
-                return system_messages + recent_messages
-        split_point = max(0, len(conversation) - self.memory_max_messages + 2)
-        older_messages = conversation[:split_point]
-        recent_messages = conversation[split_point:]
-        if older_messages and len(older_messages) >= self.summarize_threshold:
-            total_msgs = len(older_messages)
-            last_msg = older_messages[-1].get('content', '')
+        if conversation_count <= self.memory_max_messages or has_memory_summary:
+            return system_messages + list(conversation)
+        older_count = min(conversation_count, max(0, conversation_count - self.memory_max_messages + 2))
+        keep_count = conversation_count - older_count
+        first_recent = len(conversation) - keep_count
+        recent_messages = list(islice(conversation, first_recent, None))
+        if older_count and older_count >= self.summarize_threshold:
+            last_msg = conversation[first_recent - 1].get('content', '')
             if len(last_msg) > 100:
                 last_msg = last_msg[:97] + "..."
             summary_message = {
                 "role": "system",
-                "content": f"Previous conversation with {total_msgs} messages. Most recent topic: {last_msg}",
+                "content": f"Previous conversation with {older_count} messages. Most recent topic: {last_msg}",
             }
             return system_messages + [summary_message] + recent_messages
         return system_messages + recent_messages
@@ -1,13 +1,26 @@
 import asyncio
+import hashlib
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.config.settings import settings
 from src.utils.audio.audio_handling import AudioProcessorMainApp
 
 logger = logging.getLogger(__name__)
 
+# Failure markers stripped from transcripts, compiled once instead of per call
+_SEGMENT_FAILURE_RE = re.compile(r"\[Segment \d+ transcription failed\]\s*")
+_TRANSCRIBE_FAILURE_RE = re.compile(r"Failed to transcribe audio.*$")
+_PROCESSING_ERROR_RE = re.compile(r"Error processing audio.*$")
+
+# Successful transcriptions keyed by (model_id, digest of the optimized audio), so re-submitted
+# recordings skip the inference API. Module-level because services are built per request.
+_TRANSCRIPTION_CACHE_MAX_ENTRIES = 1024
+_transcription_cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+
+
 class SpeechRecognitionService:
     def __init__(self, external_api_client, audio_repository, audio_processor: Optional[AudioProcessorMainApp] = None):
         self.external_api_client = external_api_client
@@ -25,30 +38,32 @@ class SpeechRecognitionService:
     ) -> List[Dict[str, Any]]:
         try:
             selected_model = model_id if model_id else self.default_model_id
-            logger.info(f"Processing audio with model {selected_model}")
+            logger.info("Processing audio with model %s", selected_model)
             if not self.audio_processor.validate_content_type(content_type):
-                logger.error(f"Invalid content type: {content_type}")
+                logger.error("Invalid content type: %s", content_type)
                 return [{"index": 0, "text": "Error: Invalid audio format."}]
-            optimized_audio = self.audio_processor.optimize_for_stt(audio_content, content_type)
+            # Decoding/resampling is blocking (pydub, possibly an ffmpeg subprocess), so it runs on the
+            # audio thread pool; concurrent uploads convert in parallel instead of stalling the event loop
+            optimized_audio = await self.audio_processor.optimize_for_stt_async(audio_content, content_type)
             if not optimized_audio:
                 logger.error("Failed to optimize audio")
                 return [{"index": 0, "text": "Error: Failed to process audio file."}]
-            audio_id = None
+            transcription = self._transcribe(selected_model, optimized_audio)
             if store_audio:
-                audio_id = await self.audio_repository.save_audio(
-                    audio_content=optimized_audio,
-                    content_type="audio/wav",
-                    conversation_id=conversation_id,
-                    ttl_hours=24
+                # Storing the audio doesn't depend on the transcription, so overlap it with the API call
+                result, audio_id = await asyncio.gather(
+                    transcription,
+                    self.audio_repository.save_audio(
+                        audio_content=optimized_audio,
+                        content_type="audio/wav",
+                        conversation_id=conversation_id,
+                        ttl_hours=24
+                    )
                 )
-            result = await asyncio.to_thread(
-                self.external_api_client.speech_to_text,
-                model_id=selected_model,
-                audio_content=optimized_audio,
-                content_type="audio/wav"
-            )
+            else:
+                result, audio_id = await transcription, None
             if not result["success"]:
-                logger.error(f"API error: {result.get('error')}")
+                logger.error("API error: %s", result.get('error'))
                 return [{
                     "index": 0,
                     "text": result["text"],
@@ -60,15 +75,37 @@ class SpeechRecognitionService:
                 "audio_id": audio_id
             }]
         except Exception as e:
-            logger.error(f"Unexpected error in audio processing: {str(e)}")
+            logger.error("Unexpected error in audio processing: %s", e)
             return [{"index": 0, "text": f"Error processing audio file: {str(e)}"}]
 
+    async def _transcribe(self, model_id: str, audio: bytes) -> Dict[str, Any]:
+        key = (model_id, hashlib.blake2b(audio, digest_size=16).digest())
+        cached = _transcription_cache.get(key)
+        if cached is not None:
+            _transcription_cache.move_to_end(key)
+            return cached
+        result = await self.external_api_client.speech_to_text(
+            model_id=model_id,
+            audio_content=audio,
+            content_type="audio/wav"
+        )
+        # Failures are often transient (model loading, timeouts), so only successes are kept
+        if result["success"]:
+            _transcription_cache[key] = result
+            if len(_transcription_cache) > _TRANSCRIPTION_CACHE_MAX_ENTRIES:
+                _transcription_cache.popitem(last=False)
+        return result
+
     def clean_transcription(self, transcriptions: List[Dict[str, Any]]) -> str:
-        sorted_transcriptions = sorted(transcriptions, key=lambda x: x.get("index", 0))
-        full_text = " ".join([t.get("text", "") for t in sorted_transcriptions])
-        clean_text = re.sub(r"\[Segment \d+ transcription failed\]\s*", "", full_text).strip()
-        clean_text = re.sub(r"Failed to transcribe audio.*$", "", clean_text).strip()
-        clean_text = re.sub(r"Error processing audio.*$", "", clean_text).strip()
+        if len(transcriptions) == 1:
+            # process_audio_file returns a single segment, so skip the sort and join
+            full_text = transcriptions[0].get("text", "")
+        else:
+            sorted_transcriptions = sorted(transcriptions, key=lambda x: x.get("index", 0))
+            full_text = " ".join([t.get("text", "") for t in sorted_transcriptions])
+        clean_text = _SEGMENT_FAILURE_RE.sub("", full_text).strip()
+        clean_text = _TRANSCRIBE_FAILURE_RE.sub("", clean_text).strip()
+        clean_text = _PROCESSING_ERROR_RE.sub("", clean_text).strip()
         if not clean_text:
             clean_text = "Unable to transcribe audio clearly. Please try again with a clearer recording."
         return clean_text
@@ -78,18 +115,15 @@ class SpeechRecognitionService:
 
     async def warm_up_inference_api(self) -> None:
         try:
-            logger.info(f"Warming up Hugging Face Inference API for model: {self.default_model_id}")
+            logger.info("Warming up Hugging Face Inference API for model: %s", self.default_model_id)
             audio_content = self.audio_processor.create_silent_audio(duration=0.5)
-            # Wrap the synchronous call in asyncio.to_thread so we can await it
-            result = await asyncio.to_thread(
-                self.external_api_client.speech_to_text,
+            await self.external_api_client.speech_to_text(
                 model_id=self.default_model_id,
                 audio_content=audio_content,
                 content_type="audio/wav",
                 max_retries=1
             )
-            logger.info("Waiting for model to initialize...")
-            await asyncio.sleep(2)
+            # The request itself triggers model loading; nothing downstream waits on a settle delay
             logger.info("Warm-up complete")
         except Exception as e:
-            logger.warning(f"Failed to warm up inference API: {str(e)}")
+            logger.warning("Failed to warm up inference API: %s", e)
@@ -1,20 +1,41 @@
 import logging
-import base64
-import asyncio
-from typing import Dict, Optional, Any, Tuple
+import binascii
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Any, Tuple
 from src.config.settings import settings
-from src.utils.audio.audio_handling import AudioProcessorMainApp
+
+if TYPE_CHECKING:
+    from src.utils.audio.audio_handling import AudioProcessorMainApp
 logger = logging.getLogger(__name__)
 
+_VOICE_CACHE_TTL = settings.tts.VOICE_CACHE_TTL
+# (expires_at, voices result); module-level because the service is built per request
+_voice_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _encode_base64(audio_content: bytes) -> str:
+    # b2a_base64 reads the buffer in place; the ASCII decode is the single copy into the str
+    return binascii.b2a_base64(audio_content, newline=False).decode("ascii")
+
+
 class TextToSpeechService:
-    def __init__(self, external_api_client, audio_repository, audio_processor: Optional[AudioProcessorMainApp] = None):
+    # Built per request with a fixed attribute set; slots skip the per-instance dict
+    __slots__ = ("external_api_client", "audio_repository", "_audio_processor", "default_voice_id", "tts_model_id")
+
+    def __init__(self, external_api_client, audio_repository, audio_processor: Optional["AudioProcessorMainApp"] = None):
         self.external_api_client = external_api_client
         self.audio_repository = audio_repository
-        self.audio_processor = audio_processor or AudioProcessorMainApp()
+        self._audio_processor = audio_processor
         self.default_voice_id = settings.tts.DEFAULT_VOICE_ID
         self.tts_model_id = settings.tts.TTS_MODEL_ID
-        self.voice_cache = None
-        self.voice_cache_timestamp = None
+
+    @property
+    def audio_processor(self) -> "AudioProcessorMainApp":
+        # Synthesis never touches it, so the pydub-backed processor is only built on first use
+        if self._audio_processor is None:
+            from src.utils.audio.audio_handling import AudioProcessorMainApp
+            self._audio_processor = AudioProcessorMainApp()
+        return self._audio_processor
 
     async def synthesize_speech(
             self, text: str, voice_id: Optional[str] = None,
@@ -25,15 +46,14 @@ class TextToSpeechService:
             voice_id = self.default_voice_id
 
         # Get speech from ElevenLabs
-        result = await asyncio.to_thread(
-            self.external_api_client.text_to_speech,
+        result = await self.external_api_client.text_to_speech(
             text=text,
             voice_id=voice_id,
             model_id=self.tts_model_id
         )
 
         if not result["success"]:
-            logger.error(f"Failed to generate speech: {result.get('error')}")
+            logger.error("Failed to generate speech: %s", result.get('error'))
             return {
                 "success": False,
                 "error": result.get("error", "Unknown error in speech synthesis"),
@@ -41,8 +61,12 @@ class TextToSpeechService:
                 "file_id": None
             }
 
+        audio_base64 = None
         try:
             audio_content = result["audio_content"]
+            # Encoded once up front so the storage-error fallback can reuse it
+            if return_base64:
+                audio_base64 = _encode_base64(audio_content)
             # Save the audio directly as MP3
             file_id = await self.audio_repository.save_audio(
                 audio_content=audio_content,
@@ -59,15 +83,13 @@ class TextToSpeechService:
             }
 
             if return_base64:
-                audio_base64 = base64.b64encode(audio_content).decode("utf-8")
                 response["audio_base64"] = audio_base64
 
             return response
         except Exception as e:
-            logger.error(f"Error handling speech synthesis: {str(e)}")
+            logger.error("Error handling speech synthesis: %s", e)
             # Try to return base64 if available
-            if return_base64 and "audio_content" in result:
-                audio_base64 = base64.b64encode(result["audio_content"]).decode("utf-8")
+            if audio_base64 is not None:
                 return {
                     "success": True,
                     "audio_base64": audio_base64,
@@ -85,9 +107,10 @@ class TextToSpeechService:
         return await self.audio_repository.get_audio(file_id)
 
     async def get_available_voices(self) -> Dict[str, Any]:
-        if self.voice_cache is not None:
-            return self.voice_cache
-        result = await asyncio.to_thread(self.external_api_client.get_voices)
+        global _voice_cache
+        if _voice_cache is not None and _voice_cache[0] > time.monotonic():
+            return _voice_cache[1]
+        result = await self.external_api_client.get_voices()
         if result.get("success", False):
-            self.voice_cache = result
+            _voice_cache = (time.monotonic() + _VOICE_CACHE_TTL, result)
         return result
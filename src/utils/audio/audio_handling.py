@@ -1,10 +1,13 @@
 # src/utils/audio/lightweight_audio_processor.py
+import asyncio
 import io
+import struct
 import wave
 import logging
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Union
+from typing import BinaryIO, Optional, Dict, List, Union
 import os
 
 if "PATH" not in os.environ:
@@ -15,6 +18,61 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Blocking pydub/ffmpeg work from async handlers runs here, so it neither stalls the event loop
+# nor competes with other users of the loop's default executor; threads start on demand
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="audio")
+
+_FORMAT_MAP = {
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/mpeg": "mp3",
+    "audio/webm": "webm"
+}
+
+
+def _wav_bytes(pcm, sample_rate: int, channels: int, sample_width: int) -> bytes:
+    """Wrap raw PCM in the canonical 44-byte header, byte-for-byte as the wave module writes it."""
+    data_size = len(pcm)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * channels * sample_width,
+        channels * sample_width, sample_width * 8,
+        b"data", data_size
+    )
+    return b"".join((header, pcm))
+
+
+@lru_cache(maxsize=4)
+def _silent_wav(sample_rate: int, channels: int, num_samples: int) -> bytes:
+    """16-bit silent WAV bytes; the payload only depends on its arguments, so build it once."""
+    return _wav_bytes(bytes(num_samples * 2), sample_rate, channels, 2)
+
+
+def _wav_params(audio_content: bytes) -> Optional[tuple]:
+    """Read a PCM WAV's getparams() from its header only; None if it isn't one the wave module reads."""
+    try:
+        with wave.open(io.BytesIO(audio_content), "rb") as wf:
+            return wf.getparams()
+    except (wave.Error, EOFError):
+        return None
+
+
+def _wav_duration(fileobj: BinaryIO, size: int) -> Optional[float]:
+    """
+    Duration of a PCM WAV from its header, without decoding samples; None if it isn't one
+    the wave module reads. The frame count is capped by the bytes actually present, as
+    streamed recordings often leave a placeholder data size.
+    """
+    try:
+        with wave.open(fileobj, "rb") as wf:
+            # wave stops right after the data chunk header, so the stream sits at the first sample
+            available = (size - fileobj.tell()) // (wf.getsampwidth() * wf.getnchannels())
+            return min(wf.getnframes(), available) / wf.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
 class AudioProcessorMainApp:
     """
     Audio processing class for the main FastAPI app.
@@ -25,12 +83,21 @@ class AudioProcessorMainApp:
         self.sample_rate = self.config.audio.AUDIO_SAMPLE_RATE
         self.channels = self.config.audio.AUDIO_CHANNELS
         self.format = self.config.audio.AUDIO_FORMAT
+        self._allowed_content_types = frozenset(self.config.audio.ALLOWED_AUDIO_CONTENT_TYPES)
 
     def get_audio_duration(self, audio_source: Union[str, Path, bytes]) -> float:
         try:
+            # Header-only fast path for WAV; anything else is decoded by pydub/ffmpeg
             if isinstance(audio_source, (str, Path)):
+                with open(audio_source, "rb") as f:
+                    duration = _wav_duration(f, os.fstat(f.fileno()).st_size)
+                if duration is not None:
+                    return duration
                 audio = AudioSegment.from_file(str(audio_source))
             elif isinstance(audio_source, bytes):
+                duration = _wav_duration(io.BytesIO(audio_source), len(audio_source))
+                if duration is not None:
+                    return duration
                 audio = AudioSegment.from_file(io.BytesIO(audio_source))
             else:
                 raise ValueError(f"Unsupported type: {type(audio_source)}")
@@ -40,21 +107,20 @@ class AudioProcessorMainApp:
             return 0.0
 
     def get_audio_format(self, content_type: str) -> str:
-        format_map = {
-            "audio/wav": "wav",
-            "audio/x-wav": "wav",
-            "audio/mpeg": "mp3",
-            "audio/webm": "webm"
-        }
-        return format_map.get(content_type, "wav")
+        return _FORMAT_MAP.get(content_type, "wav")
 
     def validate_content_type(self, content_type: str) -> bool:
-        return content_type in self.config.audio.ALLOWED_AUDIO_CONTENT_TYPES
+        return content_type in self._allowed_content_types
 
     def optimize_for_stt(self, audio_content: bytes, content_type: str) -> Optional[bytes]:
+        audio_format = self.get_audio_format(content_type)
+        if audio_format == "wav" and self.format == "wav":
+            params = _wav_params(audio_content)
+            if params is not None and params.nchannels == self.channels and params.framerate == self.sample_rate:
+                # Already in the target layout; decoding and re-exporting would only rewrite the same PCM
+                return audio_content
         try:
-            audio = AudioSegment.from_file(io.BytesIO(audio_content),
-                                           format=self.get_audio_format(content_type))
+            audio = AudioSegment.from_file(io.BytesIO(audio_content), format=audio_format)
             optimized = audio.set_channels(self.channels).set_frame_rate(self.sample_rate)
             buffer = io.BytesIO()
             optimized.export(buffer, format=self.format)
@@ -63,6 +129,12 @@ class AudioProcessorMainApp:
             logger.error(f"Optimize error: {e}")
             return None
 
+    async def optimize_for_stt_async(self, audio_content: bytes, content_type: str) -> Optional[bytes]:
+        """optimize_for_stt on the audio thread pool, for use from async handlers."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _AUDIO_POOL, self.optimize_for_stt, audio_content, content_type
+        )
+
     def split_audio(self, audio_content: bytes, content_type: str,
                     segment_duration: Optional[float] = None) -> List[Dict]:
         if segment_duration is None:
@@ -71,31 +143,63 @@ class AudioProcessorMainApp:
             audio = AudioSegment.from_file(io.BytesIO(audio_content),
                                            format=self.get_audio_format(content_type))
             audio = audio.set_channels(self.channels).set_frame_rate(self.sample_rate)
-            seg_ms = int(segment_duration * 1000)
+            # Segment on whole samples; ms-based slicing re-derives sample offsets from rounded
+            # milliseconds and can drop or pad samples at the boundaries
+            seg_frames = round(segment_duration * audio.frame_rate)
+            if self.format == "wav" and audio.sample_width > 1:
+                return self._split_pcm(audio, seg_frames)
+            frame_rate = audio.frame_rate
+            total_frames = int(audio.frame_count())
             segments = []
-            for i, start in enumerate(range(0, len(audio), seg_ms)):
-                seg = audio[start:start+seg_ms]
-                buffer = io.BytesIO()
+            # One buffer for every export; after the first segment it is already large enough
+            buffer = io.BytesIO()
+            for i, start in enumerate(range(0, total_frames, seg_frames)):
+                end = min(start + seg_frames, total_frames)
+                seg = audio.get_sample_slice(start, end)
+                buffer.seek(0)
+                buffer.truncate()
                 seg.export(buffer, format=self.format)
                 segments.append({
                     "index": i,
                     "audio_bytes": buffer.getvalue(),
-                    "start_time": start / 1000,
-                    "end_time": min((start + seg_ms) / 1000, len(audio) / 1000)
+                    "start_time": start / frame_rate,
+                    "end_time": end / frame_rate
                 })
             return segments
         except Exception as e:
             logger.error(f"Split error: {e}")
             return []
 
+    async def split_audio_async(self, audio_content: bytes, content_type: str,
+                                segment_duration: Optional[float] = None) -> List[Dict]:
+        """split_audio on the audio thread pool, for use from async handlers."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _AUDIO_POOL, self.split_audio, audio_content, content_type, segment_duration
+        )
+
+    @staticmethod
+    def _split_pcm(audio: AudioSegment, seg_frames: int) -> List[Dict]:
+        """
+        WAV split_audio path: slice the converted PCM once per segment and add a header,
+        instead of a pydub slice plus export for each one.
+        """
+        pcm = memoryview(audio.raw_data)
+        frame_width = audio.frame_width
+        frame_rate = audio.frame_rate
+        total_frames = len(pcm) // frame_width
+        segments = []
+        for i, start in enumerate(range(0, total_frames, seg_frames)):
+            end = min(start + seg_frames, total_frames)
+            segments.append({
+                "index": i,
+                "audio_bytes": _wav_bytes(pcm[start * frame_width:end * frame_width],
+                                          frame_rate, audio.channels, audio.sample_width),
+                "start_time": start / frame_rate,
+                "end_time": end / frame_rate
+            })
+        return segments
+
     def create_silent_audio(self, duration: float = 0.5, sample_rate: Optional[int] = None) -> bytes:
         if sample_rate is None:
             sample_rate = self.sample_rate
-        samples = np.zeros(int(sample_rate * duration), dtype=np.int16)
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        return buffer.getvalue()
+        return _silent_wav(sample_rate, self.channels, int(sample_rate * duration))
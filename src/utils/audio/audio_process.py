@@ -2,48 +2,87 @@ import io
 import logging
 import torch
 import torchaudio
+import soundfile
 import gc
+import math
+import os
+import threading
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 from src.utils.audio.audio_handling import AudioProcessorMainApp
 
 logger = logging.getLogger(__name__)
 
+# Resample builds its polyphase kernel in __init__, so keep one per rate pair for the process;
+# module-level because AudioProcessor instances are created per component
+_resamplers: Dict[Tuple[int, int], torchaudio.transforms.Resample] = {}
+_resamplers_lock = threading.Lock()
+
+
+def _get_resampler(orig_sr: int, target_sr: int) -> torchaudio.transforms.Resample:
+    key = (orig_sr, target_sr)
+    resampler = _resamplers.get(key)
+    if resampler is None:
+        with _resamplers_lock:
+            resampler = _resamplers.get(key)
+            if resampler is None:
+                resampler = _resamplers[key] = torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=target_sr)
+    return resampler
+
 class AudioProcessor(AudioProcessorMainApp):
     """
     Audio processing class that includes the additional methods
     requiring torch and torchaudio. Inherits from LightweightAudioProcessor.
     """
-    def load_audio(self, audio_source: Union[str, Path, bytes], normalize: bool = True) -> Tuple[torch.Tensor, int]:
+    def load_audio(
+            self,
+            audio_source: Union[str, Path, bytes],
+            normalize: bool = True,
+            pin_memory: bool = False
+    ) -> Tuple[torch.Tensor, int]:
         try:
             if isinstance(audio_source, (str, Path)):
                 waveform, sr = torchaudio.load(audio_source)
             elif isinstance(audio_source, bytes):
-                with io.BytesIO(audio_source) as buf:
-                    waveform, sr = torchaudio.load(buf)
+                waveform, sr = self._decode_bytes(audio_source)
             else:
                 raise ValueError(f"Unsupported type: {type(audio_source)}")
-            if waveform.shape[0] > self.channels:
-                waveform = torch.mean(waveform, dim=0, keepdim=True)
+            waveform = self.convert_to_mono(waveform)
             if sr != self.sample_rate:
                 waveform, sr = self.resample(waveform, sr, self.sample_rate)
             if normalize:
                 waveform = self.normalize_audio(waveform)
+            if pin_memory and torch.cuda.is_available():
+                # Page-locked host memory lets later .to("cuda", non_blocking=True) copies run async
+                waveform = waveform.pin_memory()
             return waveform, sr
         except Exception as e:
             logger.error(f"Load audio error: {e}")
             raise
 
+    @staticmethod
+    def _decode_bytes(audio_content: bytes) -> Tuple[torch.Tensor, int]:
+        # libsndfile decodes WAV/FLAC/OGG in-process, avoiding torchaudio's per-call backend setup;
+        # float32 and (channels, frames) match torchaudio.load, and from_numpy wraps without a copy
+        try:
+            data, sr = soundfile.read(io.BytesIO(audio_content), dtype="float32", always_2d=True)
+            return torch.from_numpy(data.T), sr
+        except RuntimeError:
+            # Formats libsndfile can't read (mp3, webm) still go through torchaudio
+            with io.BytesIO(audio_content) as buf:
+                return torchaudio.load(buf)
+
     def resample(self, waveform: torch.Tensor, orig_sr: int, target_sr: Optional[int] = None) -> Tuple[torch.Tensor, int]:
         if target_sr is None:
             target_sr = self.sample_rate
         if orig_sr != target_sr:
-            resampler = torchaudio.transforms.Resample(orig_freq=orig_sr, new_freq=target_sr)
-            return resampler(waveform), target_sr
+            return _get_resampler(orig_sr, target_sr)(waveform), target_sr
         return waveform, orig_sr
 
     def normalize_audio(self, waveform: torch.Tensor, target_db: float = -20.0) -> torch.Tensor:
-        rms = torch.sqrt(torch.mean(waveform ** 2))
+        # vector_norm reduces in one pass without materializing waveform ** 2; matches the
+        # mean-of-squares RMS up to float rounding, on any device
+        rms = torch.linalg.vector_norm(waveform) / math.sqrt(waveform.numel())
         if rms > 0:
             target_rms = 10 ** (target_db / 20)
             return waveform * (target_rms / rms)
@@ -62,7 +101,17 @@ class AudioProcessor(AudioProcessorMainApp):
 
     @staticmethod
     def limit_cpu_cores(num_cores: int = None) -> None:
+        """
+        Limit torch to `num_cores` threads and, on Linux, pin the process to that many of its
+        allowed CPUs so the scheduler doesn't migrate threads (and their caches) across cores.
+
+        OpenMP/MKL read OMP_NUM_THREADS/MKL_NUM_THREADS when torch is first imported, so those
+        have to be set in the environment before the process starts; setting them here is too late.
+        """
         if num_cores:
             torch.set_num_threads(num_cores)
             if hasattr(torch, 'set_num_interop_threads'):
                 torch.set_num_interop_threads(num_cores)
+            if hasattr(os, 'sched_setaffinity'):
+                allowed = sorted(os.sched_getaffinity(0))
+                os.sched_setaffinity(0, allowed[:num_cores])
@@ -1,9 +1,93 @@
-import json
+import contextlib
+import mmap
 import os
-from sklearn.model_selection import train_test_split
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+import numpy as np
+import orjson
 
 from src.config.settings import settings
 
+# Shard size for streaming splits; matches the block size Arrow/Ray readers split work on
+SHARD_SIZE_BYTES = 128 * 1024 * 1024
+
+
+def _split_sizes(num_records: int) -> Tuple[int, int]:
+    """(n_test, n_val) for `num_records` records, computed once from the configured fractions."""
+    n_test = round(num_records * settings.data.DATA_TEST_SIZE)
+    n_val = min(round(num_records * settings.data.DATA_VAL_SIZE), num_records - n_test)
+    return n_test, n_val
+
+
+def _approximate_mode(class_counts: np.ndarray, n_draws: int) -> np.ndarray:
+    """
+    Spread `n_draws` across classes in proportion to `class_counts` (largest remainder),
+    so the per-class numbers add up to exactly `n_draws` and never exceed a class's count.
+    """
+    total = class_counts.sum()
+    if not total:
+        return np.zeros_like(class_counts)
+    continuous = class_counts * (n_draws / total)
+    allocated = np.floor(continuous).astype(np.int64)
+    missing = n_draws - int(allocated.sum())
+    if missing > 0:
+        # Stable sort so ties go to the earlier class and the result is deterministic
+        allocated[np.argsort(allocated - continuous, kind='stable')[:missing]] += 1
+    return allocated
+
+
+def _read_json_array(input_file: str) -> list:
+    # Parse straight from the page cache: no text-mode decode or intermediate str copy
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _staging_path(path: str) -> str:
+    # Hidden sibling in the same directory, so the final os.replace is an atomic rename
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f'.{name}.tmp')
+
+
+def _write_splits(data: list, split_indices, output_dir: str) -> None:
+    """
+    Write each (split_name, indices) pair as `{split_name}.jsonl`, looking records up in `data`.
+
+    The files are staged and only renamed into place once every split has been written, so
+    an interrupted run leaves the previous split files untouched instead of truncated ones.
+    """
+    outputs = [os.path.join(output_dir, f'{split_name}.jsonl') for split_name, _ in split_indices]
+
+    def dump_split(output_file, indices):
+        # JSONL, one record per line: no pretty-printing, and readers can stream it
+        with open(_staging_path(output_file), 'wb', buffering=1 << 20) as f:
+            f.writelines(orjson.dumps(data[i]) + b'\n' for i in indices)
+
+    try:
+        # The files are independent; writes release the GIL, so one split's disk I/O
+        # overlaps the next one's serialization
+        with ThreadPoolExecutor(max_workers=len(split_indices)) as executor:
+            # list() re-raises any write error here
+            list(executor.map(dump_split, outputs, (indices for _, indices in split_indices)))
+    except BaseException:
+        for output_file in outputs:
+            with contextlib.suppress(OSError):
+                os.remove(_staging_path(output_file))
+        raise
+    for output_file in outputs:
+        os.replace(_staging_path(output_file), output_file)
+
+
+def _print_summary(num_records: int, n_train: int, n_val: int, n_test: int) -> None:
+    scale = 100.0 / max(num_records, 1)
+    print(
+        f"\nData splitting complete:\n"
+        f"- Total samples: {num_records}\n"
+        f"- Training samples: {n_train} ({n_train * scale:.1f}%)\n"
+        f"- Validation samples: {n_val} ({n_val * scale:.1f}%)\n"
+        f"- Test samples: {n_test} ({n_test * scale:.1f}%)"
+    )
+
 
 class DataSplitter:
     @staticmethod
@@ -12,45 +96,177 @@ class DataSplitter:
             output_dir: str,
             config=None  # Kept for backward compatibility but not used
     ) -> None:
-        """Split ASR data into training, validation and test sets using settings."""
+        """
+        Split ASR data (a JSON array) into training, validation and test sets using settings,
+        written as train.jsonl, validation.jsonl and test.jsonl.
+        """
         os.makedirs(output_dir, exist_ok=True)
 
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json_array(input_file)
         except Exception as e:
             print(f"Error reading input file: {e}")
             return
 
-        # First split: separate test set
-        train_val_data, test_data = train_test_split(
-            data,
-            test_size=settings.DATA_TEST_SIZE,
-            random_state=settings.DATA_RANDOM_SEED
-        )
+        # One seeded shuffle cut into test/validation/train; train takes the remainder
+        n_test, n_val = _split_sizes(len(data))
+        perm = np.random.default_rng(settings.data.DATA_RANDOM_SEED).permutation(len(data))
+        # Index views into the permutation; records are looked up as they are written,
+        # so no per-split copy of the dataset is ever built
+        _write_splits(data, (
+            ('train', perm[n_test + n_val:]),
+            ('validation', perm[n_test:n_test + n_val]),
+            ('test', perm[:n_test]),
+        ), output_dir)
+
+        _print_summary(len(data), len(data) - n_test - n_val, n_val, n_test)
 
-        # Second split: separate train and validation from remaining data
-        relative_val_size = settings.DATA_VAL_SIZE / \
-                            (settings.DATA_TRAIN_SIZE + settings.DATA_VAL_SIZE)
-        train_data, val_data = train_test_split(
-            train_val_data,
-            test_size=relative_val_size,
-            random_state=settings.DATA_RANDOM_SEED
+    @staticmethod
+    def split_data_stratified(
+            input_file: str,
+            output_dir: str,
+            label_key: str
+    ) -> None:
+        """
+        Like split_data, but keep the distribution of `label_key` (e.g. speaker or locale)
+        the same in every split. Records without the key are grouped under an empty label.
+
+        Fully vectorized, so it stays fast with thousands of classes.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        try:
+            data = _read_json_array(input_file)
+        except Exception as e:
+            print(f"Error reading input file: {e}")
+            return
+
+        num_records = len(data)
+        n_test, n_val = _split_sizes(num_records)
+        # The fixed-width label array can rival the records in size; it is only needed to
+        # derive class ids, so it is not kept around while the splits are written
+        _, class_ids, class_counts = np.unique(
+            np.array([str(record.get(label_key, '')) for record in data]),
+            return_inverse=True,
+            return_counts=True
         )
+        # Same totals as split_data, distributed over the classes
+        test_counts = _approximate_mode(class_counts, n_test)
+        val_counts = _approximate_mode(class_counts - test_counts, n_val)
 
-        splits = {
-            'train': train_data,
-            'validation': val_data,
-            'test': test_data
-        }
+        rng = np.random.default_rng(settings.data.DATA_RANDOM_SEED)
+        # Shuffle, then group by class with a stable sort: random order within each class
+        perm = rng.permutation(num_records)
+        order = perm[np.argsort(class_ids[perm], kind='stable')]
+        sorted_ids = class_ids[order]
+        del perm, class_ids
+        # Position of each record within its class
+        rank = np.arange(num_records) - (np.cumsum(class_counts) - class_counts)[sorted_ids]
+        test_end = test_counts[sorted_ids]
+        val_end = test_end + val_counts[sorted_ids]
+
+        # Reshuffle each split so the files aren't grouped by class
+        _write_splits(data, (
+            ('train', rng.permutation(order[rank >= val_end])),
+            ('validation', rng.permutation(order[(rank >= test_end) & (rank < val_end)])),
+            ('test', rng.permutation(order[rank < test_end])),
+        ), output_dir)
+
+        _print_summary(num_records, num_records - n_test - n_val, n_val, n_test)
+
+    @staticmethod
+    def split_data_streaming(
+            input_file: str,
+            output_dir: str,
+            shard_size: int = SHARD_SIZE_BYTES
+    ) -> None:
+        """
+        Split a JSONL manifest (one record per line) into train/validation/test JSONL shards.
+
+        Records are assigned to splits by line index and copied as raw bytes, so nothing is
+        parsed and memory stays flat regardless of the manifest size. Each split is written as
+        `{split}-00000.jsonl`, `{split}-00001.jsonl`, ... rolling over at about `shard_size`
+        bytes, and the shard lists are recorded in `splits.json`.
+
+        Shards are renamed into place as they are closed, so a failed run loses at most the
+        shard in flight; `splits.json` is written last and marks a complete split.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        try:
+            # First pass only counts records; blank lines are skipped in both passes
+            with open(input_file, 'rb') as f:
+                num_records = sum(1 for line in f if line.strip())
+        except Exception as e:
+            print(f"Error reading input file: {e}")
+            return
+
+        n_test, n_val = _split_sizes(num_records)
+        perm = np.random.default_rng(settings.data.DATA_RANDOM_SEED).permutation(num_records)
+        # 0 = train, 1 = validation, 2 = test, indexed by record position
+        assignment = np.zeros(num_records, dtype=np.uint8)
+        assignment[perm[:n_test]] = 2
+        assignment[perm[n_test:n_test + n_val]] = 1
 
-        for split_name, split_data in splits.items():
-            output_file = os.path.join(output_dir, f'{split_name}.json')
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(split_data, f, indent=2, ensure_ascii=False)
+        split_names = ('train', 'validation', 'test')
+        shard_files = [[] for _ in split_names]
+        shard_bytes = [0, 0, 0]
+        writers = []
+
+        def open_shard(split):
+            file_name = f'{split_names[split]}-{len(shard_files[split]):05d}.jsonl'
+            shard_files[split].append(file_name)
+            shard_bytes[split] = 0
+            return open(_staging_path(os.path.join(output_dir, file_name)), 'wb', buffering=1 << 20)
+
+        def close_shard(split):
+            writers[split].close()
+            shard_path = os.path.join(output_dir, shard_files[split][-1])
+            os.replace(_staging_path(shard_path), shard_path)
+
+        counts = [0, 0, 0]
+        completed = False
+        try:
+            for split in range(len(split_names)):
+                writers.append(open_shard(split))
+            with open(input_file, 'rb') as f:
+                index = 0
+                for line in f:
+                    if not line.strip():
+                        continue
+                    if not line.endswith(b'\n'):
+                        line += b'\n'
+                    split = assignment[index]
+                    if shard_bytes[split] and shard_bytes[split] + len(line) > shard_size:
+                        close_shard(split)
+                        writers[split] = open_shard(split)
+                    writers[split].write(line)
+                    shard_bytes[split] += len(line)
+                    counts[split] += 1
+                    index += 1
+            completed = True
+        finally:
+            for split, writer in enumerate(writers):
+                if completed:
+                    close_shard(split)
+                else:
+                    # Drop the in-flight shard; the ones already renamed are complete
+                    writer.close()
+                    with contextlib.suppress(OSError):
+                        os.remove(writer.name)
+
+        manifest = {
+            split_name: {"files": files, "num_records": count}
+            for split_name, files, count in zip(split_names, shard_files, counts)
+        }
+        manifest_path = os.path.join(output_dir, 'splits.json')
+        with open(_staging_path(manifest_path), 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        os.replace(_staging_path(manifest_path), manifest_path)
 
-        print(f"\nData splitting complete:")
-        print(f"- Total samples: {len(data)}")
-        print(f"- Training samples: {len(train_data)} ({len(train_data) / len(data) * 100:.1f}%)")
-        print(f"- Validation samples: {len(val_data)} ({len(val_data) / len(data) * 100:.1f}%)")
-        print(f"- Test samples: {len(test_data)} ({len(test_data) / len(data) * 100:.1f}%)")
+        scale = 100.0 / max(num_records, 1)
+        lines = [f"\nData splitting complete:", f"- Total samples: {num_records}"]
+        for split_name, count, files in zip(split_names, counts, shard_files):
+            label = 'Training' if split_name == 'train' else split_name.capitalize()
+            lines.append(f"- {label} samples: {count} ({count * scale:.1f}%) in {len(files)} shard(s)")
+        print("\n".join(lines))
@@ -1,6 +1,6 @@
 from datasets import Dataset, DatasetDict, Audio
 import os
-import json
+import orjson
 
 class DatasetCreator:
     @staticmethod
@@ -14,9 +14,9 @@ class DatasetCreator:
         data = {}
 
         for split in splits:
-            json_path = os.path.join(data_dir, f"{split}.json")
-            with open(json_path, 'r', encoding='utf-8') as f:
-                entries = json.load(f)
+            jsonl_path = os.path.join(data_dir, f"{split}.jsonl")
+            with open(jsonl_path, 'rb') as f:
+                entries = [orjson.loads(line) for line in f if line.strip()]
 
             for entry in entries:
                 entry['audio'] = os.path.join(audio_dir, entry['file_name'])
@@ -1,14 +1,45 @@
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
 import kagglehub
 from src.config.settings import settings
 
+# Lowercased once for hashed suffix checks; the setting itself stays an ordered list because
+# DatasetProcessor globs the extensions in order
+_AUDIO_EXTENSIONS = frozenset(ext.lower() for ext in settings.data.DATA_AUDIO_EXTENSIONS)
+
+# Written into the extracted directory once the dataset is in place, so later runs can skip
+# both the download and the directory scan
+READY_MARKER = ".ready"
+
+
+def _has_audio_file(root: Path) -> bool:
+    """Depth-first scandir walk that stops at the first file with an audio extension."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS:
+                    return True
+    return False
+
+
+def _write_ready_marker(extracted_path: Path) -> None:
+    """Record that `extracted_path` holds the configured dataset, with its file count."""
+    file_count = sum(len(files) for _, _, files in os.walk(extracted_path))
+    (extracted_path / READY_MARKER).write_text(f"{settings.data.DATA_KAGGLE_DATASET}\n{file_count}\n")
+
+
 class DatasetManager:
     def __init__(self):
         """Initialize the dataset manager with settings."""
         self.dataset_path: Optional[Path] = None
         self.extracted_path: Optional[Path] = None
+        # Extracted path already found to contain audio, so verify_dataset needn't walk it again
+        self._verified_path: Optional[Path] = None
 
     def download_dataset(self) -> Path:
         try:
@@ -17,14 +48,24 @@ class DatasetManager:
             # Expect audio files to be inside an "output" subdirectory
             final_extracted_path = output_dir / "output"
 
-            # If the dataset already exists here, skip download
-            if final_extracted_path.exists():
-                audio_files = list(final_extracted_path.rglob('*'))
-                if any(file.suffix.lower() in settings.data.DATA_AUDIO_EXTENSIONS for file in audio_files):
-                    print(f"Dataset already exists at {final_extracted_path}. Skipping download.")
-                    self.dataset_path = output_dir
-                    self.extracted_path = final_extracted_path
-                    return output_dir
+            # If the dataset already exists here, skip download. Reading the marker directly is
+            # the only filesystem call on this path; a missing marker just means "not ready"
+            try:
+                ready = (final_extracted_path / READY_MARKER).read_text().startswith(
+                    f"{settings.data.DATA_KAGGLE_DATASET}\n"
+                )
+            except OSError:
+                ready = False
+            if not ready and final_extracted_path.exists() and _has_audio_file(final_extracted_path):
+                # Extracted before markers existed; scan once and mark it
+                _write_ready_marker(final_extracted_path)
+                ready = True
+            if ready:
+                print(f"Dataset already exists at {final_extracted_path}. Skipping download.")
+                self.dataset_path = output_dir
+                self.extracted_path = final_extracted_path
+                self._verified_path = final_extracted_path
+                return output_dir
 
             # Create the output directory if it does not exist
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -44,10 +85,17 @@ class DatasetManager:
                 # Move the entire folder to the final destination in your repo
                 shutil.move(str(temp_output), str(final_extracted_path))
             else:
-                # Otherwise, move all downloaded contents into final_extracted_path
-                final_extracted_path.mkdir(parents=True, exist_ok=True)
-                for item in default_download_path.iterdir():
-                    shutil.move(str(item), str(final_extracted_path))
+                # Otherwise, move all downloaded contents into final_extracted_path: a single
+                # directory rename when on the same filesystem and the target is absent or empty
+                try:
+                    os.replace(default_download_path, final_extracted_path)
+                except OSError:
+                    # Cross-device or non-empty target; shutil.move renames or copies item by item
+                    final_extracted_path.mkdir(parents=True, exist_ok=True)
+                    for item in default_download_path.iterdir():
+                        shutil.move(str(item), str(final_extracted_path))
+
+            _write_ready_marker(final_extracted_path)
 
             # Save internal paths for later use
             self.dataset_path = output_dir
@@ -67,6 +115,11 @@ class DatasetManager:
         if not self.extracted_path or not self.extracted_path.exists():
             return False
 
+        if self._verified_path == self.extracted_path:
+            return True
+
         # Check if at least one audio file exists in the extracted path
-        audio_files = list(self.extracted_path.rglob('*'))
-        return any(file.suffix.lower() in settings.data.DATA_AUDIO_EXTENSIONS for file in audio_files)
+        if _has_audio_file(self.extracted_path):
+            self._verified_path = self.extracted_path
+            return True
+        return False